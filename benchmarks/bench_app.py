@@ -0,0 +1,123 @@
+# Renders every chapter of app.py headlessly through Streamlit's AppTest on
+# synthetic data (benchmarks/synthetic.py) at one or more scale factors:
+#   cold - first render in a fresh process state: every st.cache_* and query
+#          cache emptied, so the connection and dataset store are rebuilt
+#   warm - a new session rendering the chapter on the warmed-up process
+#          (median of --repeat)
+#   peak - peak Python allocations of the cold render (--memory, slower)
+#
+#   python benchmarks/bench_app.py --scales 1,10,100 --dsn postgresql://localhost/bench --replace
+#   python benchmarks/bench_app.py --scales 1,10,100 --snapshot /tmp/setu-bench
+#
+# With --dsn the tourism_data tables of that database are replaced by the
+# synthetic ones, so point it at a scratch database.
+
+import argparse
+import gc
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import streamlit as st  # noqa: E402
+from streamlit import config as st_config, logger as st_logger  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+import synthetic  # noqa: E402
+from setu import cache  # noqa: E402
+
+APP = os.path.join(ROOT, "app.py")
+
+
+def chapters():
+    # The sidebar's chapter list, from the chapter registry rather than duplicated
+    from setu.chapters import CHAPTERS
+    return list(CHAPTERS)
+
+
+def reset_caches():
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    cache.clear_all()
+    gc.collect()
+
+
+def render(chapter, secrets, timeout):
+    at = AppTest.from_file(APP, default_timeout=timeout)
+    for key, value in secrets.items():
+        at.secrets[key] = value
+    at.session_state["app_mode"] = chapter
+    start = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - start
+    errors = [e.value for e in at.error] + [str(e.value) for e in at.exception]
+    return elapsed, errors
+
+
+def bench_chapter(chapter, secrets, repeat, trace_memory, timeout):
+    reset_caches()
+    cold, errors = render(chapter, secrets, timeout)
+    warm = statistics.median(render(chapter, secrets, timeout)[0] for _ in range(repeat))
+    peak = None
+    if trace_memory:
+        reset_caches()
+        tracemalloc.start()
+        render(chapter, secrets, timeout)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return cold, warm, peak, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-chapter cold/warm render latency of app.py on synthetic data")
+    parser.add_argument("--scales", default="1,10", help="comma-separated scale factors")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--dsn", help="scratch Postgres database to load and serve from")
+    target.add_argument("--snapshot", help="root directory for an embedded DuckDB snapshot instead")
+    parser.add_argument("--replace", action="store_true", help="allow replacing existing tourism_data tables (--dsn)")
+    parser.add_argument("--no-load", action="store_true", help="benchmark the data already there")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--memory", action="store_true", help="also report peak Python allocations (slower)")
+    parser.add_argument("--timeout", type=float, default=300, help="seconds allowed per render")
+    args = parser.parse_args()
+    # Bare-mode "no runtime"/"missing ScriptRunContext" warnings on every render and cache clear
+    st_config.set_option("logger.level", "error")
+    st_logger.set_log_level("error")
+
+    if args.dsn:
+        secrets = {"postgres_neon": {"dsn": args.dsn}}
+    else:
+        secrets = {"backend": "snapshot", "snapshot_root": args.snapshot}
+    secrets["dataset_refresh_seconds"] = 0  # no background reloads between measurements
+
+    print(f"{'scale':>6} {'chapter':40s} {'cold ms':>10} {'warm ms':>10}" + (f" {'peak MB':>8}" if args.memory else "") + "  errors")
+    for scale in [float(s) for s in args.scales.split(",")]:
+        if not args.no_load:
+            frames = synthetic.generate(scale)
+            if args.dsn:
+                import psycopg2
+                conn = psycopg2.connect(args.dsn)
+                try:
+                    synthetic.load_postgres(conn, frames, args.replace)
+                finally:
+                    conn.close()
+            else:
+                synthetic.load_snapshot(args.snapshot, frames, scale)
+        for chapter in chapters():
+            cold, warm, peak, errors = bench_chapter(chapter, secrets, args.repeat, args.memory, args.timeout)
+            line = f"{scale:>6g} {chapter:40s} {cold * 1000:>10.1f} {warm * 1000:>10.1f}"
+            if args.memory:
+                line += f" {peak / 2**20:>8.1f}"
+            print(line + f"  {len(errors) or ''}", flush=True)
+            for error in errors:
+                print(f"{'':>8}! {str(error)[:200]}")
+    reset_caches()
+
+
+if __name__ == "__main__":
+    main()
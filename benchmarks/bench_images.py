@@ -0,0 +1,120 @@
+# Exercises setu/images.py against a local HTTP stand-in for the image hosts:
+# a page of card images fetched cold, then warm, with some URLs slow (past the
+# fetch timeout), missing (404) or not images, and a few URLs serving the same
+# bytes. Reports wall time per pass, requests that reached the server, and
+# original vs thumbnail bytes.
+#
+#   python benchmarks/bench_images.py [--cards 60] [--width 300]
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from setu.images import ImageCache  # noqa: E402
+
+
+def make_image(i, size=(1600, 1200)):
+    img = Image.new("RGB", size, ((i * 37) % 256, (i * 91) % 256, (i * 53) % 256))
+    buffer = io.BytesIO()
+    img.save(buffer, "JPEG", quality=90)
+    return buffer.getvalue()
+
+
+class StandIn(BaseHTTPRequestHandler):
+    # /img/<i>.jpg serves image i % distinct, /slow/<i>.jpg the same after
+    # sleeping past the timeout, /text/ is not an image, anything else is a 404
+    images = {}
+    distinct = 1
+    delay = 0.0
+    requests = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with StandIn.lock:
+            StandIn.requests += 1
+        kind, _, name = self.path.strip("/").partition("/")
+        if kind == "slow":
+            time.sleep(self.delay)
+        if kind in ("img", "slow"):
+            body, content_type = self.images[int(name.split(".")[0]) % self.distinct], "image/jpeg"
+        elif kind == "text":
+            body, content_type = b"<html>not an image</html>", "text/html"
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Clients that gave up on a slow response
+        pass
+
+
+def page(cache, urls, width, workers=8):
+    # As a chapter renders: every card's thumbnail requested at once
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        paths = list(executor.map(lambda url: cache.thumbnail(url, width), urls))
+    return paths, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the card image cache against a local HTTP stand-in")
+    parser.add_argument("--cards", type=int, default=60)
+    parser.add_argument("--width", type=int, default=300)
+    parser.add_argument("--timeout", type=float, default=1.0, help="fetch timeout; the slow URLs take twice as long")
+    args = parser.parse_args()
+
+    StandIn.distinct = max(1, args.cards * 3 // 4)
+    StandIn.images = {i: make_image(i) for i in range(StandIn.distinct)}
+    StandIn.delay = args.timeout * 2
+    server = StandInServer(("127.0.0.1", 0), StandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    # Mostly images (a quarter of them duplicates), plus one slow, one missing and one non-image URL per 20 cards
+    kinds = ["slow", "missing", "text"]
+    urls = [f"{base}/{kinds[i // 20 % 3] if i % 20 == 19 else 'img'}/{i}.jpg" for i in range(args.cards)]
+
+    with tempfile.TemporaryDirectory() as root:
+        cache = ImageCache(root, timeout=args.timeout)
+        print(f"{'pass':>12} {'wall ms':>10} {'requests':>9} {'images':>7}")
+        for name in ("cold", "warm"):
+            before = StandIn.requests
+            paths, wall = page(cache, urls, args.width)
+            print(f"{name:>12} {wall * 1000:>10.1f} {StandIn.requests - before:>9} {sum(p is not None for p in paths):>7}")
+        # A new process over the same directory: nothing is downloaded again
+        before = StandIn.requests
+        paths, wall = page(ImageCache(root, timeout=args.timeout), urls, args.width)
+        print(f"{'restarted':>12} {wall * 1000:>10.1f} {StandIn.requests - before:>9} {sum(p is not None for p in paths):>7}")
+
+        originals = sum(e.stat().st_size for e in os.scandir(os.path.join(root, "originals")))
+        thumbs = [e.stat().st_size for e in os.scandir(os.path.join(root, "thumbs"))]
+        print(f"originals: {len(os.listdir(os.path.join(root, 'originals')))} files, {originals / 2**10:.0f} KiB "
+              f"for {sum(p is not None for p in paths)} image URLs")
+        print(f"thumbnails ({cache.format}, {args.width}px): {len(thumbs)} files, {sum(thumbs) / 2**10:.0f} KiB")
+        print(cache.stats())
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+# Rerun latency of app.py's interactive panels on synthetic data
+# (benchmarks/synthetic.py). Each widget change below is timed two ways, on
+# a warmed-up process:
+#   full  - the whole script rerun with the new widget value, which is what
+#           every interaction cost before the panels were fragments
+#   panel - only the fragment holding the widget rerun, the way the browser
+#           asks for it after a change inside a st.fragment
+# AppTest itself always reruns the whole script, so the panel runs go through
+# its runner with fragment storage that lives as long as the session, as a
+# browser session's does. The compiled script is kept across runs, as the
+# server keeps it (AppTest would otherwise recompile app.py on every run,
+# which costs more than most reruns). Medians of --repeat fresh sessions.
+#
+#   python benchmarks/bench_reruns.py --scale 10 --dsn postgresql://localhost/bench --replace
+#   python benchmarks/bench_reruns.py --scale 10 --snapshot /tmp/setu-bench
+#
+# --app points it at another checkout's app.py (e.g. the revision before the
+# fragments) for its full-rerun numbers; panel runs are then skipped.
+
+import argparse
+import functools
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from streamlit import config as st_config, logger as st_logger  # noqa: E402
+from streamlit.runtime.fragment import MemoryFragmentStorage  # noqa: E402
+from streamlit.runtime.scriptrunner import RerunData  # noqa: E402
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache  # noqa: E402
+from streamlit.testing.v1 import AppTest, local_script_runner  # noqa: E402
+
+import synthetic  # noqa: E402
+from bench_app import reset_caches  # noqa: E402
+
+HOME = "🏠 Home & Tourism Overview"
+ARTS = "🎨 Traditional Art Forms"
+DESTINATIONS = "🏛️ Explore Cultural Destinations"
+SCHEMES = "💰 Government Support & Schemes"
+SEASONALITY = "📅 Plan Your Visit (Seasonality)"
+GEMS = "💎 Untouched Cultural Gems"
+
+# (interaction, chapter, session state set before the first run, panel function, widget change)
+INTERACTIONS = [
+    ("top 10 visitor type", HOME, {}, "top_states_panel",
+     lambda at: at.selectbox(key="home_visitor_type").select_index(1)),
+    ("rising states period", HOME, {}, "rising_states_panel",
+     lambda at: at.selectbox(key="home_rising_period").select_index(-1)),
+    ("art form category", ARTS, {}, "art_forms_panel",
+     lambda at: at.selectbox(key="art_cat").select_index(1)),
+    ("art form next page", ARTS, {}, "art_forms_panel",
+     lambda at: at.button(key="art_page_next").click()),
+    ("rising monuments year", DESTINATIONS, {}, "rising_monuments_panel",
+     lambda at: at.selectbox(key="rising_mon_period").select_index(-1)),
+    ("rising monuments visitors", DESTINATIONS, {}, "rising_monuments_panel",
+     lambda at: at.radio(key="rising_mon_visitor_type_global").set_value("Foreign Visitors")),
+    ("monument detail circle", DESTINATIONS, {}, "monument_trends_panel",
+     lambda at: at.selectbox(key="mon_circle_select_detail").select_index(1)),
+    ("monument detail monument", DESTINATIONS, {}, "monument_trends_panel",
+     lambda at: at.selectbox(key="mon_name_select_detail").select_index(-1)),
+    ("overall funds schemes", SCHEMES, {}, "overall_funds_panel",
+     lambda at: at.multiselect(key="worm_plot_schemes").unselect(at.multiselect(key="worm_plot_schemes").value[0])),
+    ("scheme explorer scheme", SCHEMES, {}, "scheme_explorer_panel",
+     lambda at: at.selectbox(key="specific_scheme_select_tab3").set_value("Museum Development Grants")),
+    ("beneficiaries next page", SCHEMES, {}, "syas_panel",
+     lambda at: at.button(key="syas_next_page").click()),
+    ("beneficiaries state", SCHEMES, {}, "syas_panel",
+     lambda at: at.selectbox(key="syas_state_filter_tab3").select_index(1)),
+    ("guru-shishya states", SCHEMES, {"specific_scheme_select_tab3": "Guru-Shishya Parampara (Assistance)"}, "guru_shishya_panel",
+     lambda at: at.multiselect(key="gsp_state_multiselect_revised").unselect(at.multiselect(key="gsp_state_multiselect_revised").value[0])),
+    ("museum grants year", SCHEMES, {"specific_scheme_select_tab3": "Museum Development Grants"}, "museum_grants_panel",
+     lambda at: at.selectbox(key="museum_year_select_revised").select_index(1)),
+    ("seasonality year", SEASONALITY, {}, "fta_seasonality_panel",
+     lambda at: at.selectbox(key="fta_year_select").select_index(-1)),
+    ("gems next page", GEMS, {}, "untouched_gems_panel",
+     lambda at: at.button(key="gem_page_next").click()),
+]
+
+
+class SessionFragments(MemoryFragmentStorage):
+    # Fragment storage kept across a session's runs, knowing each fragment by
+    # the name of the function it renders
+    def __init__(self):
+        super().__init__()
+        self.ids = {}
+
+    def set(self, key, value):
+        super().set(key, value)
+        cells = dict(zip(value.__code__.co_freevars, value.__closure__))
+        self.ids[cells["non_optional_func"].cell_contents.__name__] = key
+
+
+SCRIPT_CACHE = ScriptCache()
+
+
+def session(app, chapter, state, secrets, timeout):
+    fragments = SessionFragments()
+    local_script_runner.MemoryFragmentStorage = lambda: fragments
+    at = AppTest.from_file(app, default_timeout=timeout)
+    for key, value in secrets.items():
+        at.secrets[key] = value
+    at.session_state["app_mode"] = chapter
+    for key, value in state.items():
+        at.session_state[key] = value
+    at.run()
+    return at, fragments
+
+
+def rerun(at, fragment_id=None):
+    # -> (seconds, errors) of the rerun after a widget change; with fragment_id, of that fragment alone
+    if fragment_id is not None:
+        local_script_runner.RerunData = functools.partial(RerunData, fragment_id_queue=[fragment_id], is_fragment_scoped_rerun=True)
+    try:
+        start = time.perf_counter()
+        at.run()
+        elapsed = time.perf_counter() - start
+    finally:
+        local_script_runner.RerunData = RerunData
+    return elapsed, [e.value for e in at.error] + [str(e.value) for e in at.exception]
+
+
+def bench_interaction(app, interaction, secrets, repeat, timeout):
+    _, chapter, state, panel, change = interaction
+    full, scoped, errors = [], [], []
+    for _ in range(repeat):
+        at, _ = session(app, chapter, state, secrets, timeout)
+        change(at)
+        elapsed, run_errors = rerun(at)
+        full.append(elapsed)
+        errors += run_errors
+
+        at, fragments = session(app, chapter, state, secrets, timeout)
+        if panel in fragments.ids:
+            change(at)
+            elapsed, run_errors = rerun(at, fragments.ids[panel])
+            scoped.append(elapsed)
+            errors += run_errors
+    return statistics.median(full), statistics.median(scoped) if scoped else None, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Full-script vs panel-only rerun latency of app.py's widgets on synthetic data")
+    parser.add_argument("--scale", type=float, default=1)
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--dsn", help="scratch Postgres database to load and serve from")
+    target.add_argument("--snapshot", help="root directory for an embedded DuckDB snapshot instead")
+    parser.add_argument("--replace", action="store_true", help="allow replacing existing tourism_data tables (--dsn)")
+    parser.add_argument("--no-load", action="store_true", help="benchmark the data already there")
+    parser.add_argument("--app", default=os.path.join(ROOT, "app.py"), help="script to run (default: this checkout's app.py)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=300, help="seconds allowed per run")
+    args = parser.parse_args()
+    st_config.set_option("logger.level", "error")
+    st_logger.set_log_level("error")
+
+    if args.dsn:
+        secrets = {"postgres_neon": {"dsn": args.dsn}}
+    else:
+        secrets = {"backend": "snapshot", "snapshot_root": args.snapshot}
+    secrets["dataset_refresh_seconds"] = 0  # no background reloads between measurements
+
+    if not args.no_load:
+        frames = synthetic.generate(args.scale)
+        if args.dsn:
+            import psycopg2
+            conn = psycopg2.connect(args.dsn)
+            try:
+                synthetic.load_postgres(conn, frames, args.replace)
+            finally:
+                conn.close()
+        else:
+            synthetic.load_snapshot(args.snapshot, frames, args.scale)
+
+    local_script_runner.ScriptCache = lambda: SCRIPT_CACHE
+    reset_caches()
+    print(f"{'interaction':28s} {'full ms':>10} {'panel ms':>10} {'speedup':>8}  errors")
+    for interaction in INTERACTIONS:
+        full, scoped, errors = bench_interaction(args.app, interaction, secrets, args.repeat, args.timeout)
+        line = f"{interaction[0]:28s} {full * 1000:>10.1f} "
+        line += f"{scoped * 1000:>10.1f} {full / scoped:>7.1f}x" if scoped else f"{'-':>10} {'-':>8}"
+        print(line + f"  {len(errors) or ''}", flush=True)
+        for error in errors[:3]:
+            print(f"{'':>4}! {str(error)[:200]}")
+    reset_caches()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+# Startup and per-rerun overhead of the app, one fresh Python process per
+# chapter, so every import is paid again as on a new server:
+#   first run - a new process's first render of the chapter: imports, backend
+#               and dataset store setup, and the render itself
+#   imports   - the part of the first run spent importing modules, from
+#               python -X importtime
+#   modules   - modules the first run imported, and which of the optional
+#               heavy ones (drivers, Pillow, search, chapter modules) among them
+#   rerun     - median of --reruns further runs of the same session with nothing
+#               changed: what every widget outside a panel costs on top of the
+#               chapter's own work (for Responsible Tourism, which has no data,
+#               that is all of it)
+# The compiled script is kept across runs, as the server keeps it. Medians of
+# --repeat processes per chapter.
+#
+#   python benchmarks/bench_startup.py --snapshot snapshots
+#   python benchmarks/bench_startup.py --dsn postgresql://localhost/bench
+#
+# --app points it at another checkout's app.py (e.g. the single-script app
+# before the chapter modules) for comparison.
+
+import argparse
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Modules only some chapters or backends need, reported when a first run loads them
+OPTIONAL = ["psycopg2", "duckdb", "snowflake.connector", "PIL", "setu.search", "setu.indexes", "setu.images"]
+MARK = "bench_startup: first run"
+
+
+def child(app, chapter, secrets, reruns, timeout):
+    # Runs in the fresh process: one session's first run and its reruns
+    from streamlit import config as st_config, logger as st_logger
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1 import AppTest, local_script_runner
+
+    st_config.set_option("logger.level", "error")
+    st_logger.set_log_level("error")
+    script_cache = ScriptCache()
+    local_script_runner.ScriptCache = lambda: script_cache
+
+    at = AppTest.from_file(app, default_timeout=timeout)
+    for key, value in secrets.items():
+        at.secrets[key] = value
+    at.session_state["app_mode"] = chapter
+    before = set(sys.modules)
+    print(f"{MARK} start", file=sys.stderr, flush=True)
+    start = time.perf_counter()
+    at.run()
+    first = time.perf_counter() - start
+    print(f"{MARK} end", file=sys.stderr, flush=True)
+    loaded = set(sys.modules) - before
+
+    times = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - start)
+    return {
+        "first": first,
+        "modules": len(loaded),
+        "optional": [name for name in OPTIONAL if name in loaded],
+        "chapters": sorted(name.rsplit(".", 1)[1] for name in loaded if name.startswith("setu.chapters.")),
+        "rerun": statistics.median(times),
+        "errors": [e.value for e in at.error] + [str(e.value) for e in at.exception],
+    }
+
+
+def import_seconds(stderr):
+    # Sum of the top-level imports -X importtime logged between the markers
+    total, inside = 0, False
+    for line in stderr.splitlines():
+        if line.startswith(MARK):
+            inside = line.endswith("start")
+        elif inside and line.startswith("import time:") and not line.startswith("import time: self"):
+            _, cumulative, name = line[len("import time:"):].split("|")
+            if not name[1:].startswith(" "):
+                total += int(cumulative)
+    return total / 1e6
+
+
+def chapters(app):
+    # The chapter titles: from the chapter registry, or the chapters list of a single-script app.py
+    with open(app, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "chapters" for t in node.targets):
+            return ast.literal_eval(node.value)
+    from setu.chapters import CHAPTERS
+    return list(CHAPTERS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-chapter startup and per-rerun overhead of app.py, one fresh process each")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--dsn", help="Postgres database to serve from")
+    target.add_argument("--snapshot", help="root directory of an embedded DuckDB snapshot instead")
+    parser.add_argument("--app", default=os.path.join(ROOT, "app.py"), help="script to run (default: this checkout's app.py)")
+    parser.add_argument("--repeat", type=int, default=3, help="processes per chapter")
+    parser.add_argument("--reruns", type=int, default=10)
+    parser.add_argument("--timeout", type=float, default=300, help="seconds allowed per run")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.dsn:
+        secrets = {"postgres_neon": {"dsn": args.dsn}}
+    else:
+        secrets = {"backend": "snapshot", "snapshot_root": args.snapshot}
+    secrets["dataset_refresh_seconds"] = 0
+    if args.child:
+        # The app's own directory first, as streamlit run puts it, so --app imports that checkout's setu
+        sys.path.insert(0, os.path.dirname(os.path.abspath(args.app)))
+        print(json.dumps(child(args.app, args.child, secrets, args.reruns, args.timeout)))
+        return
+
+    print(f"{'chapter':40s} {'first ms':>9} {'imports ms':>10} {'modules':>8} {'rerun ms':>9}  loaded")
+    for chapter in chapters(args.app):
+        results = []
+        for _ in range(args.repeat):
+            command = [sys.executable, "-X", "importtime", os.path.abspath(__file__), "--child", chapter, "--app", args.app,
+                       "--reruns", str(args.reruns), "--timeout", str(args.timeout)]
+            command += ["--dsn", args.dsn] if args.dsn else ["--snapshot", args.snapshot]
+            done = subprocess.run(command, capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(args.app)))
+            if done.returncode:
+                raise SystemExit(done.stderr[-2000:])
+            result = json.loads(done.stdout.strip().splitlines()[-1])
+            result["imports"] = import_seconds(done.stderr)
+            results.append(result)
+        median = {key: statistics.median(r[key] for r in results) for key in ("first", "imports", "modules", "rerun")}
+        loaded = results[0]["optional"] + [f"chapters.{name}" for name in results[0]["chapters"]]
+        print(f"{chapter:40s} {median['first'] * 1000:>9.1f} {median['imports'] * 1000:>10.1f} {median['modules']:>8.0f} "
+              f"{median['rerun'] * 1000:>9.1f}  {', '.join(loaded)}", flush=True)
+        for error in results[0]["errors"][:3]:
+            print(f"{'':>4}! {str(error)[:200]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+# Synthetic data for every table the app reads, at a configurable scale
+# factor, and a loader into a local Postgres or an embedded DuckDB snapshot.
+#
+#   python benchmarks/synthetic.py --scale 10 --dsn postgresql://localhost/bench --replace
+#   python benchmarks/synthetic.py --scale 10 --snapshot /tmp/setu-bench
+#
+# Scale 1 is roughly the size of the published datasets (a few dozen states,
+# ~150 ticketed monuments, a few thousand scheme beneficiaries); entity
+# counts (states, monuments, circles, art forms, beneficiaries, ...) grow
+# linearly with the scale, the year columns the chapters select on do not.
+# The rows the queries filter out ('Total...' rows, 'Others', duplicate
+# report years in ftamonthly) are generated too, so every WHERE clause and
+# window function does real work. Same seed, same data.
+
+import argparse
+import io
+import math
+import os
+import shutil
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from setu import queries, summaries  # noqa: E402
+
+# Column types, as far as app.py can tell from what it reads
+SCHEMA = {
+    "state_tourism_visits": {
+        "state_ut": "text", "domestic_visitors_yr1": "bigint", "foreign_visitors_yr1": "bigint",
+        "domestic_visitors_yr2": "bigint", "foreign_visitors_yr2": "bigint",
+        "data_period_yr1": "text", "data_period_yr2": "text",
+    },
+    "all_monuments_stats": {
+        "circle": "text", "monument_name": "text", "financial_year_range": "text",
+        "domestic_visitors_fy_start": "bigint", "foreign_visitors_fy_start": "bigint",
+        "domestic_visitors_fy_end": "bigint", "foreign_visitors_fy_end": "bigint",
+    },
+    "top_monuments": {
+        "monument_name": "text", "financial_year": "text", "visitor_type": "text",
+        "number_of_visitors": "bigint", "data_rank": "integer",
+    },
+    "ftamonthly": {"month_name": "text", "data_year": "integer", "fta_count": "bigint", "report_source_year": "integer"},
+    "traditionalartforms": {
+        "artformname": "text", "stateoforigin": "text", "category": "text", "briefdescription": "text",
+        "imageurl": "text", "responsibleconsumptiontip": "text",
+    },
+    "untouchedgems": {
+        "gemname": "text", "state": "text", "region": "text", "type": "text", "culturalsignificance": "text",
+        "whypotentiallyuntouched": "text", "responsibletravelguideline": "text", "imageurl": "text",
+    },
+    "artistsupportschemesummary": {
+        "schemeid": "text", "schemename": "text", "administeringbody": "text", "focusarea": "text",
+        "datapoint_example_state_ut": "text", "datapoint_example_value": "text", "relevancetoplatform": "text",
+    },
+    "senioryoungartistscheme": {
+        "new_states": "text", "subject": "text", "gender": "text", "age": "integer",
+        "phy_handicaped": "text", "sc_st": "text", "user_id": "bigint", "field_id": "bigint",
+    },
+    "buildinggrantsstudiotheatre": {
+        "state_ut": "text", "amount_21_22": "numeric", "amount_22_23": "numeric", "amount_released_authorized_23_24": "numeric",
+    },
+    "veteranartistsapplications": {
+        "state_ut": "text", "apps_2019_20": "integer", "apps_2020_21": "integer", "apps_2021_22": "integer",
+        "apps_2022_23": "integer", "apps_2023_24": "integer",
+    },
+    "gurushishyaparamparaassistance": {
+        "state_ut": "text", "amount_21_22": "numeric", "amount_22_23": "numeric", "amount_released_authorized_23_24": "numeric",
+    },
+    "culturalfunctionproductiongrant": {
+        "state_ut": "text", "amount_21_22": "numeric", "amount_22_23": "numeric", "amount_released_23_24": "numeric",
+    },
+    "schemewisefundsreleased": {
+        "scheme_name": "text", "funds_2019_20": "numeric", "funds_2020_21": "numeric", "funds_2021_22": "numeric",
+        "funds_2022_23": "numeric", "funds_2023_24": "numeric",
+    },
+    "museumgrantschemefunds": {
+        "state_name": "text", "organization_name": "text", "type_of_museum": "text", "funds_2019_20": "numeric",
+        "funds_2020_21": "numeric", "funds_2021_22": "numeric", "funds_2022_23": "numeric", "funds_2023_24": "numeric",
+    },
+    "asimonumentpreservationexpenditure": {"year": "text", "allocation": "numeric", "expenditure": "numeric"},
+}
+
+MONTHS = ["January", "February", "March", "April", "May", "June",
+          "July", "August", "September", "October", "November", "December"]
+MONUMENT_FYS = ["2020-2021", "2021-2022", "2022-2023"]
+WORDS = ("temple fort palace stepwell weaving pottery painting dance music theatre puppetry village festival "
+         "folk tribal bronze stone silk handloom mural scroll ritual pilgrimage river hill desert coastal "
+         "heritage craft artisan guild natural dyes lacquer embroidery woodcarving monastery cave").split()
+
+
+def _names(prefix, n):
+    return np.array([f"{prefix} {i}" for i in range(n)], dtype=object)
+
+
+def _text(rng, n, n_words=12):
+    return np.array([" ".join(words) for words in rng.choice(WORDS, size=(n, n_words))], dtype=object)
+
+
+def _with_total(df, column, label="Total"):
+    # Appends the 'Total' row the queries filter out; integer columns become
+    # nullable so the row's NULLs survive the trip through COPY/Parquet.
+    df = df.astype({col: "Int64" for col, dtype in df.dtypes.items() if pd.api.types.is_integer_dtype(dtype)})
+    total = pd.DataFrame({col: pd.array([label if col == column else None], dtype=df[col].dtype) for col in df.columns})
+    return pd.concat([df, total], ignore_index=True)
+
+
+def generate(scale=1, seed=0):
+    # -> {table: DataFrame} for every table in setu.queries.TABLES
+    rng = np.random.default_rng(seed)
+    n_states = math.ceil(36 * scale)
+    states = _names("State", n_states)
+    frames = {}
+
+    periods = [("2021", "2022"), ("2022", "2023")]
+    visits = pd.DataFrame({
+        "state_ut": np.tile(states, len(periods)),
+        "domestic_visitors_yr1": rng.integers(0, 10**8, n_states * len(periods)),
+        "foreign_visitors_yr1": rng.integers(0, 10**6, n_states * len(periods)),
+        "domestic_visitors_yr2": rng.integers(0, 10**8, n_states * len(periods)),
+        "foreign_visitors_yr2": rng.integers(0, 10**6, n_states * len(periods)),
+        "data_period_yr1": np.repeat([p[0] for p in periods], n_states),
+        "data_period_yr2": np.repeat([p[1] for p in periods], n_states),
+    })
+    frames["state_tourism_visits"] = _with_total(visits, "state_ut")
+
+    n_monuments = math.ceil(150 * scale)
+    n_circles = math.ceil(30 * math.sqrt(scale))
+    monuments = _names("Monument", n_monuments)
+    circle_of = _names("Circle", n_circles)[rng.integers(0, n_circles, n_monuments)]
+    n = n_monuments * len(MONUMENT_FYS)
+    # ~5% of monuments open (or start being counted) within a year: start = 0
+    starts = rng.integers(0, 10**6, n) * (rng.random(n) > 0.05)
+    stats = pd.DataFrame({
+        "circle": np.tile(circle_of, len(MONUMENT_FYS)),
+        "monument_name": np.tile(monuments, len(MONUMENT_FYS)),
+        "financial_year_range": np.repeat(MONUMENT_FYS, n_monuments),
+        "domestic_visitors_fy_start": starts,
+        "foreign_visitors_fy_start": rng.integers(0, 10**5, n),
+        "domestic_visitors_fy_end": (starts * rng.uniform(0.6, 1.8, n)).astype(np.int64) + rng.integers(0, 1000, n),
+        "foreign_visitors_fy_end": rng.integers(0, 10**5, n),
+    })
+    frames["all_monuments_stats"] = _with_total(stats, "circle")
+
+    top = []
+    for fy in MONUMENT_FYS + ["FY2021-22", "FY2022-23"]:
+        for visitor_type in ["Domestic", "Foreign"]:
+            names = list(rng.choice(monuments, size=min(10, n_monuments), replace=False)) + ["Others"]
+            top.append(pd.DataFrame({
+                "monument_name": names,
+                "financial_year": fy,
+                "visitor_type": visitor_type,
+                "number_of_visitors": np.sort(rng.integers(10**5, 10**7, len(names)))[::-1],
+                "data_rank": np.arange(1, len(names) + 1),
+            }))
+    frames["top_monuments"] = pd.concat(top, ignore_index=True)
+
+    years = np.arange(2000, 2000 + math.ceil(10 * scale))
+    report_years = [2023, 2024]  # every month reported twice; the query keeps the latest
+    n = len(MONTHS) * len(years) * len(report_years)
+    frames["ftamonthly"] = pd.DataFrame({
+        "month_name": np.tile(MONTHS, len(years) * len(report_years)),
+        "data_year": np.tile(np.repeat(years, len(MONTHS)), len(report_years)),
+        "fta_count": rng.integers(10**5, 2 * 10**6, n),
+        "report_source_year": np.repeat(report_years, len(MONTHS) * len(years)),
+    })
+
+    n = math.ceil(60 * scale)
+    frames["traditionalartforms"] = pd.DataFrame({
+        "artformname": _names("Art Form", n),
+        "stateoforigin": rng.choice(states, n),
+        "category": rng.choice(["Painting", "Textile", "Craft", "Dance", "Music", "Theatre"], n),
+        "briefdescription": _text(rng, n, 30),
+        "imageurl": np.where(rng.random(n) < 0.8, [f"https://example.org/art/{i}.jpg" for i in range(n)], None),
+        "responsibleconsumptiontip": _text(rng, n, 10),
+    })
+
+    n = math.ceil(30 * scale)
+    frames["untouchedgems"] = pd.DataFrame({
+        "gemname": _names("Gem", n),
+        "state": rng.choice(states, n),
+        "region": rng.choice(["North", "South", "East", "West", "North-East", "Central"], n),
+        "type": rng.choice(["Village", "Temple", "Fort", "Cave", "Craft Cluster"], n),
+        "culturalsignificance": _text(rng, n, 25),
+        "whypotentiallyuntouched": _text(rng, n, 10),
+        "responsibletravelguideline": _text(rng, n, 10),
+        "imageurl": np.where(rng.random(n) < 0.8, [f"https://example.org/gem/{i}.jpg" for i in range(n)], None),
+    })
+
+    n = math.ceil(10 * scale)
+    frames["artistsupportschemesummary"] = pd.DataFrame({
+        "schemeid": [f"S{i:04d}" for i in range(n)],
+        "schemename": _names("Scheme", n),
+        "administeringbody": rng.choice(["Ministry of Culture", "Sangeet Natak Akademi", "Lalit Kala Akademi"], n),
+        "focusarea": _text(rng, n, 8),
+        "datapoint_example_state_ut": np.where(rng.random(n) < 0.7, rng.choice(states, n), None),
+        "datapoint_example_value": [f"{v} grants" for v in rng.integers(1, 500, n)],
+        "relevancetoplatform": _text(rng, n, 15),
+    })
+
+    n = math.ceil(5000 * scale)
+    frames["senioryoungartistscheme"] = pd.DataFrame({
+        "new_states": rng.choice(states, n),
+        # Untidy subjects on purpose: the chapter strips and title-cases them
+        "subject": rng.choice(["Music", " music ", "Dance", "dance", "Theatre", "Folk Art ", "Painting"], n),
+        "gender": rng.choice(["Male", "Female"], n),
+        "age": rng.integers(18, 90, n),
+        "phy_handicaped": rng.choice(["No", "Yes"], n, p=[0.95, 0.05]),
+        "sc_st": rng.choice(["No", "Yes"], n, p=[0.8, 0.2]),
+        "user_id": np.arange(1, n + 1),
+        "field_id": rng.integers(1, 50, n),
+    })
+
+    for table in ["buildinggrantsstudiotheatre", "veteranartistsapplications",
+                  "gurushishyaparamparaassistance", "culturalfunctionproductiongrant"]:
+        columns = list(SCHEMA[table])
+        high = 1000 if table == "veteranartistsapplications" else 500
+        df = pd.DataFrame({"state_ut": states, **{col: rng.integers(0, high, n_states) for col in columns[1:]}})
+        if SCHEMA[table][columns[1]] == "numeric":
+            df[columns[1:]] = df[columns[1:]] + rng.integers(0, 100, (n_states, len(columns) - 1)) / 100
+        frames[table] = _with_total(df, "state_ut")
+
+    n = math.ceil(12 * scale)
+    funds = pd.DataFrame({"scheme_name": _names("Scheme", n),
+                          **{col: rng.integers(0, 50000, n) / 100 for col in list(SCHEMA["schemewisefundsreleased"])[1:]}})
+    frames["schemewisefundsreleased"] = _with_total(funds, "scheme_name", "Grand Total")
+
+    n = math.ceil(100 * scale)
+    frames["museumgrantschemefunds"] = pd.DataFrame({
+        "state_name": rng.choice(states, n),
+        "organization_name": _names("Museum Trust", n),
+        "type_of_museum": rng.choice(["Art", "History", "Science", "Tribal", "Regional"], n),
+        **{col: rng.integers(0, 10000, n) / 100 for col in list(SCHEMA["museumgrantschemefunds"])[3:]},
+    })
+
+    n = math.ceil(10 * scale)
+    frames["asimonumentpreservationexpenditure"] = pd.DataFrame({
+        "year": [f"{2024 - n + i}-{(2025 - n + i) % 100:02d}" for i in range(n)],
+        "allocation": rng.integers(10000, 150000, n) / 100,
+        "expenditure": rng.integers(10000, 150000, n) / 100,
+    })
+
+    assert set(frames) == set(queries.TABLES) == set(SCHEMA)
+    return {table: frames[table][list(SCHEMA[table])] for table in queries.TABLES}
+
+
+def load_postgres(conn, frames, replace=False):
+    # COPY every frame into tourism_data.<table>, then rebuild the growth
+    # summaries; refuses to touch existing tables unless replace=True, since
+    # the app's schema name is fixed.
+    with conn.cursor() as cur:
+        cur.execute("CREATE SCHEMA IF NOT EXISTS tourism_data")
+        cur.execute("SELECT table_name FROM information_schema.tables WHERE table_schema = 'tourism_data'")
+        existing = {row[0] for row in cur.fetchall()} & set(frames)
+        if existing and not replace:
+            raise SystemExit(f"tourism_data already has {sorted(existing)}; pass --replace to drop and reload them")
+        for table, df in frames.items():
+            columns = ", ".join(f"{col} {sql_type}" for col, sql_type in SCHEMA[table].items())
+            cur.execute(f"DROP TABLE IF EXISTS tourism_data.{table}")
+            cur.execute(f"CREATE TABLE tourism_data.{table} ({columns})")
+            buf = io.StringIO()
+            df.to_csv(buf, index=False, header=False)
+            buf.seek(0)
+            cur.copy_expert(f"COPY tourism_data.{table} FROM STDIN WITH (FORMAT csv)", buf)
+            cur.execute(f"ANALYZE tourism_data.{table}")
+    conn.commit()
+    summaries.build(conn)
+
+
+def load_snapshot(root, frames, scale=1):
+    from setu.snapshot import write_snapshot
+    version = f"synthetic-x{scale:g}"
+    shutil.rmtree(os.path.join(root, version), ignore_errors=True)  # regenerated, not versioned
+    return write_snapshot(frames.items(), root, version=version, source="synthetic")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic data for every table app.py reads and load it")
+    parser.add_argument("--scale", type=float, default=1.0, help="scale factor (1 ~ the published datasets)")
+    parser.add_argument("--seed", type=int, default=0)
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--dsn", help="load into this Postgres database (schema tourism_data)")
+    target.add_argument("--snapshot", help="write a DuckDB/Parquet snapshot under this root instead (SETU_BACKEND=snapshot)")
+    parser.add_argument("--replace", action="store_true", help="drop and reload existing tourism_data tables")
+    args = parser.parse_args()
+
+    frames = generate(args.scale, args.seed)
+    if args.dsn:
+        import psycopg2
+        conn = psycopg2.connect(args.dsn)
+        try:
+            load_postgres(conn, frames, args.replace)
+        finally:
+            conn.close()
+    else:
+        load_snapshot(args.snapshot, frames, args.scale)
+    for table, df in frames.items():
+        print(f"{table:40s} {len(df):>10,} rows")
+
+
+if __name__ == "__main__":
+    main()
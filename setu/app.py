@@ -0,0 +1,108 @@
+import time
+
+import pandas as pd
+import streamlit as st
+
+from setu import data, queries
+from setu.chapters import CHAPTERS, chapter
+from setu.metrics import metrics
+
+# The app around the chapters, run by both entry scripts (app.py, snowflake-app.py)
+# on every full run: page config, the data backend, the sidebar (chapter
+# buttons, search, ?debug=1 panels) and the chapter picked there, whose module
+# is imported only once it is opened (setu/chapters/).
+
+# One ranked search over art forms, untouched gems and artist support schemes, built once per data refresh
+search_result_chapters = {
+    "traditionalartforms": ("Art form", "🎨 Traditional Art Forms"),
+    "untouchedgems": ("Cultural gem", "💎 Untouched Cultural Gems"),
+    "artistsupportschemesummary": ("Scheme", "💰 Government Support & Schemes"),
+}
+
+
+def open_search_result(dataset, title, context):
+    st.session_state.app_mode = search_result_chapters[dataset][1]
+    if dataset == "traditionalartforms":
+        # Narrow the art form filters down to the result, and open the page of the grid it is on
+        from setu.chapters.art_forms import ART_PAGE_SIZE
+        if pd.notna(context["stateoforigin"]):
+            st.session_state["art_state"] = context["stateoforigin"]
+        if pd.notna(context["category"]):
+            st.session_state["art_cat"] = context["category"]
+        art_filters = {"state": st.session_state.get("art_state", "All"), "category": st.session_state.get("art_cat", "All")}
+        before = data.run_query_df(data.conn, queries.ART_FORMS_BEFORE, {**{k: None if v == "All" else v for k, v in art_filters.items()}, "name": title})
+        st.session_state["art_page"] = int(before.iloc[0, 0]) // ART_PAGE_SIZE
+    elif dataset == "untouchedgems":
+        from setu.chapters.gems import GEM_PAGE_SIZE
+        before = data.run_query_df(data.conn, queries.UNTOUCHED_GEMS_BEFORE, {"name": title})
+        st.session_state["gem_page"] = int(before.iloc[0, 0]) // GEM_PAGE_SIZE
+
+
+def catalogue_search():
+    catalogue_query = st.sidebar.text_input("🔎 Search arts, gems & schemes", key="catalogue_search", placeholder="e.g. painting, cave temples")
+    if catalogue_query:
+        try:
+            from setu import search
+            with metrics.timer("transform", chapter="sidebar", stage="catalogue_search"):
+                catalogue_results = data.store.derive("catalogue_search", search.catalogue_search).search(catalogue_query, limit=8)
+            for rank, (_, (dataset, title, context)) in enumerate(catalogue_results):
+                details = " · ".join(str(value) for value in context.values() if pd.notna(value))
+                st.sidebar.button(f"{title} ({search_result_chapters[dataset][0]})", key=f"catalogue_result_{rank}",
+                                  help=details or None, on_click=open_search_result, args=(dataset, title, context), use_container_width=True)
+            if not catalogue_results:
+                st.sidebar.caption(f"Nothing matches '{catalogue_query}'.")
+        except Exception as e:
+            st.sidebar.error(f"Search is unavailable: {e}")
+
+
+def debug_panels():
+    with st.sidebar.expander("Data backend"):
+        st.json(data.conn.stats())
+    with st.sidebar.expander("Dataset store"):
+        st.json(data.store.stats())
+    with st.sidebar.expander("Query cache"):
+        for cached in (data.run_query, data.run_query_df):
+            st.caption(cached.__name__)
+            st.json({**cached.cache.stats(), **cached.cache.footprint()})
+    if data.disk_cache is not None:
+        with st.sidebar.expander("Disk cache"):
+            st.json(data.disk_cache.stats())
+    with st.sidebar.expander("Image cache"):
+        st.json(data.image_cache().stats())
+    with st.sidebar.expander("Performance"):
+        for kind in ("chapter", "panel", "transform", "query", "image"):
+            st.caption(kind)
+            st.dataframe(metrics.summary(kind), hide_index=True)
+        st.download_button("Prometheus metrics", metrics.to_prometheus(), file_name="setu_metrics.prom", mime="text/plain")
+        st.download_button("Recent events (JSON lines)", metrics.to_jsonl(), file_name="setu_metrics.jsonl", mime="application/x-ndjson")
+
+
+def main(backend=None):
+    st.set_page_config(layout="wide", page_title="Sanskriti Setu", page_icon="🕌")
+    data.connect(backend)
+
+    st.sidebar.title("📜 Sanskriti Setu")
+    st.sidebar.markdown("---")
+
+    chapters = list(CHAPTERS)
+    if 'app_mode' not in st.session_state:
+        st.session_state.app_mode = chapters[0]
+
+    for chapter_name in chapters:
+        if st.sidebar.button(chapter_name, key=f"btn_{chapter_name.replace(' ', '_').replace('&','and').replace('/','_')}", use_container_width=True):
+            st.session_state.app_mode = chapter_name
+
+    st.sidebar.markdown("---")
+    catalogue_search()
+
+    st.sidebar.markdown("---")
+    st.sidebar.info("Sanskriti Setu")
+
+    if st.query_params.get("debug") == "1":
+        debug_panels()
+
+    chapter_started = time.perf_counter()
+    chapter(st.session_state.app_mode).render()
+    metrics.record("chapter", {"chapter": st.session_state.app_mode}, time.perf_counter() - chapter_started)
+    if data.metrics_prometheus_file:
+        metrics.write_prometheus(data.metrics_prometheus_file)
@@ -0,0 +1,111 @@
+import pandas as pd
+
+from setu.fetch import concat_batches, fetch_df_copy, iter_query_batches
+
+# Changes whenever a table in the tourism_data schema is written to, from the
+# statistics Postgres keeps anyway rather than a scan of the tables: per table,
+# its oid (new when a growth summary is rebuilt) and the rows inserted, updated
+# and deleted since the statistics were last reset. A writer's counts show up
+# within about ten seconds of its connection going idle (a minute at most). A
+# reset, e.g. when Neon restarts a suspended compute, changes it too, which only
+# costs a cold disk cache. Tables that do not exist yet (summaries not built)
+# are simply absent.
+DATA_VERSION = """
+    SELECT md5(coalesce(string_agg(relname || ':' || relid || ':' || n_tup_ins || ':' || n_tup_upd || ':' || n_tup_del, ','
+                                   ORDER BY relname), ''))
+    FROM pg_stat_user_tables
+    WHERE schemaname = 'tourism_data';
+"""
+
+
+class PostgresBackend:
+    # Live Neon/Postgres database behind the connection pool.
+    name = "postgres"
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    def query_df(self, query, params=None, fetch_mode="rows"):
+        # fetch_mode="copy" bulk-loads large results via COPY TO STDOUT + Arrow (see benchmarks/bench_fetch.py),
+        # fetch_mode="stream" reads them through a server-side cursor in typed batches.
+        def fetch(conn):
+            if fetch_mode == "copy":
+                return fetch_df_copy(conn, query, params)
+            if fetch_mode == "stream":
+                return concat_batches(iter_query_batches(conn, query, params))
+            with conn.cursor() as cur:
+                cur.execute(query, params)
+                rows = cur.fetchall()
+                colnames = [desc[0] for desc in cur.description]
+                return pd.DataFrame(rows, columns=colnames)
+        return self.pool.run(fetch)
+
+    def query(self, query, params=None):
+        def fetch(conn):
+            with conn.cursor() as cur:
+                cur.execute(query, params)
+                return cur.fetchall()
+        return self.pool.run(fetch)
+
+    def iter_batches(self, query, params=None, batch_size=5000):
+        with self.pool.connection() as conn:
+            yield from iter_query_batches(conn, query, params, batch_size)
+
+    def data_version(self):
+        return self.query(DATA_VERSION)[0][0]
+
+    def stats(self):
+        return {"backend": self.name, **self.pool.stats()}
+
+
+# Changes whenever a table in the tourism_data schema is written to: per table,
+# the row count and the last DML/DDL time Snowflake keeps for it.
+SNOWFLAKE_DATA_VERSION = """
+    SELECT md5(listagg(table_name || ':' || row_count || ':' || to_varchar(last_altered), ',') WITHIN GROUP (ORDER BY table_name))
+    FROM information_schema.tables
+    WHERE table_schema = 'TOURISM_DATA';
+"""
+
+
+class SnowflakeBackend:
+    # Snowflake, through one snowflake-connector-python connection (a cursor
+    # per query). Snowflake returns unquoted identifiers in upper case; column
+    # names are lowered so pages read the same names as from the other backends.
+    name = "snowflake"
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def _execute(self, cur, query, params):
+        # With params the connector formats the query with them, which also turns %% into %;
+        # without, it sends the text as it is
+        if params is None:
+            query = query.replace("%%", "%")
+        cur.execute(query, params)
+
+    def query_df(self, query, params=None, fetch_mode="rows"):
+        # Results arrive as Arrow whatever fetch_mode asks for
+        with self.conn.cursor() as cur:
+            self._execute(cur, query, params)
+            df = cur.fetch_pandas_all()
+        df.columns = [column.lower() for column in df.columns]
+        return df
+
+    def query(self, query, params=None):
+        with self.conn.cursor() as cur:
+            self._execute(cur, query, params)
+            return cur.fetchall()
+
+    def iter_batches(self, query, params=None, batch_size=5000):
+        # Batches are the sizes Snowflake sends result chunks in, not batch_size
+        with self.conn.cursor() as cur:
+            self._execute(cur, query, params)
+            for df in cur.fetch_pandas_batches():
+                df.columns = [column.lower() for column in df.columns]
+                yield df
+
+    def data_version(self):
+        return self.query(SNOWFLAKE_DATA_VERSION)[0][0]
+
+    def stats(self):
+        return {"backend": self.name, "session_id": self.conn.session_id}
@@ -0,0 +1,351 @@
+import functools
+import hashlib
+import inspect
+import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pandas as pd
+
+from setu.metrics import metrics
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+_SQL_LITERAL = re.compile(r"('(?:[^']|'')*')")
+
+
+def normalize_sql(query):
+    # The same query written with different layout in different chapters maps
+    # to one key: whitespace collapsed (outside string literals), no space
+    # around punctuation, no trailing semicolon.
+    parts = _SQL_LITERAL.split(query.strip().rstrip(";").strip())
+    for i in range(0, len(parts), 2):
+        parts[i] = re.sub(r"\s*([(),=])\s*", r"\1", re.sub(r"\s+", " ", parts[i]))
+    return "".join(parts)
+
+
+def sizeof(value, sample=1000):
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, (list, tuple)):
+        # Rows (fetchall()) and their fields, measured on at most sample evenly
+        # spaced items and scaled up to the rest
+        if not value:
+            return sys.getsizeof(value)
+        measured = value[::max(1, len(value) // sample)]
+        return sys.getsizeof(value) + sum(sizeof(v, sample) for v in measured) * len(value) // len(measured)
+    return sys.getsizeof(value)
+
+
+class QueryCache:
+    # Stale-while-revalidate, single-flight result cache.
+    #   age < ttl              -> served from cache
+    #   ttl <= age < max_stale -> stale value served at once while exactly one
+    #                             background refresh runs for that key
+    #   age >= max_stale, miss -> callers block, but concurrent callers for the
+    #                             same key share one call to the database
+    # Like st.cache_data, arguments whose name starts with "_" are not part of
+    # the key, and DataFrames are handed out as copies. A "query" argument is
+    # keyed by its normalize_sql() form.
+    #
+    # Entries are kept in LRU order and evicted once their total deep memory
+    # size exceeds max_bytes (or their count exceeds max_entries); a single
+    # result larger than the whole budget is returned but not kept.
+    #
+    # An optional DiskTier (self.disk) is consulted on a miss before calling
+    # fn, and every DataFrame fn returns is written through to it.
+
+    def __init__(self, fn, ttl=600.0, max_stale=3600.0, max_bytes=256 * 2**20, max_entries=None, refresh_workers=4, disk=None):
+        self.fn = fn
+        self.disk = disk
+        self.ttl = ttl
+        self.max_stale = max(max_stale, ttl)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._signature = inspect.signature(fn)
+        self._entries = OrderedDict()  # key -> (value, fetched_at, nbytes), least recently used first
+        self._bytes = 0
+        self._inflight = {}  # key -> Future
+        self._lock = threading.Lock()
+        self._refresher = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix="cache-refresh")
+        self.counters = dict.fromkeys(["hits", "stale_hits", "misses", "coalesced", "refreshes", "refresh_errors", "evictions"], 0)
+
+    def key(self, args, kwargs):
+        bound = self._signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return tuple(
+            (name, normalize_sql(value) if name == "query" and isinstance(value, str) else _freeze(value))
+            for name, value in bound.arguments.items() if not name.startswith("_")
+        )
+
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+        key = self.key(args, kwargs)
+        outcome, value, nbytes = "error", None, None
+        try:
+            outcome, value, nbytes = self._get(key, args, kwargs)
+        finally:
+            query = dict(key).get("query")
+            metrics.record(
+                "query", {"source": self.fn.__name__, "query": query[:120] if isinstance(query, str) else "", "cache": outcome},
+                time.perf_counter() - start, rows=len(value) if value is not None else None, nbytes=nbytes,
+                params=dict(key).get("params"),
+            )
+        return self._hand_out(value)
+
+    def _get(self, key, args, kwargs):
+        # -> (outcome, value, nbytes)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, fetched_at, nbytes = entry
+                self._entries.move_to_end(key)
+                age = now - fetched_at
+                if age < self.ttl:
+                    self.counters["hits"] += 1
+                    return "hit", value, nbytes
+                if age < self.max_stale:
+                    self.counters["stale_hits"] += 1
+                    if key not in self._inflight:
+                        self._inflight[key] = Future()
+                        self._refresher.submit(self._refresh, key, args, kwargs)
+                    return "stale", value, nbytes
+            future = self._inflight.get(key)
+            if future is not None:
+                self.counters["coalesced"] += 1
+                leader = False
+            else:
+                self.counters["misses"] += 1
+                future = self._inflight[key] = Future()
+                leader = True
+
+        outcome = self._load(key, future, args, kwargs, use_disk=True) if leader else "coalesced"
+        value, nbytes = future.result()
+        return outcome, value, nbytes
+
+    def _load(self, key, future, args, kwargs, use_disk=False):
+        # Resolves future with (value, nbytes); returns where the value came from
+        disk = self.disk
+        disk_key = (self.fn.__module__, self.fn.__qualname__) + key
+        try:
+            value = disk.get(disk_key) if disk is not None and use_disk else None
+            source = "disk"
+            if value is None:
+                value, source = self.fn(*args, **kwargs), "miss"
+                if disk is not None:
+                    disk.put(disk_key, value)
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            return "error"
+        nbytes = sizeof(value)
+        with self._lock:
+            self._store(key, value, nbytes)
+            self._inflight.pop(key, None)
+        future.set_result((value, nbytes))
+        return source
+
+    def _store(self, key, value, nbytes):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[2]
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return
+        self._entries[key] = (value, time.monotonic(), nbytes)
+        self._bytes += nbytes
+        while self._entries and (
+            (self.max_bytes is not None and self._bytes > self.max_bytes)
+            or (self.max_entries is not None and len(self._entries) > self.max_entries)
+        ):
+            _, (_, _, evicted_bytes) = self._entries.popitem(last=False)
+            self._bytes -= evicted_bytes
+            self.counters["evictions"] += 1
+
+    def _refresh(self, key, args, kwargs):
+        future = self._inflight[key]
+        self._load(key, future, args, kwargs)
+        with self._lock:
+            if future.exception() is None:
+                self.counters["refreshes"] += 1
+            else:
+                # Keep serving the stale value; the next stale hit retries
+                self.counters["refresh_errors"] += 1
+
+    @staticmethod
+    def _hand_out(value):
+        return value.copy() if isinstance(value, pd.DataFrame) else value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def footprint(self):
+        with self._lock:
+            largest = sorted(self._entries.items(), key=lambda item: item[1][2], reverse=True)[:5]
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "max_entries": self.max_entries,
+                "largest": [{"key": repr(key)[:120], "bytes": nbytes} for key, (_, _, nbytes) in largest],
+            }
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._bytes, "inflight": len(self._inflight), **self.counters}
+
+
+class DiskTier:
+    # Results persisted as Parquet under root, so a restarted process or a new
+    # replica starts warm. Files are named by a hash of the cache key and the
+    # backend's data-version stamp: once the data changes, the stamp changes
+    # and older files are simply never read again (and pruned, oldest first,
+    # when the directory grows past max_bytes). Only DataFrames are stored;
+    # any read/write problem falls back to the database.
+
+    def __init__(self, root, data_version, max_bytes=1024 * 2**20, version_ttl=60.0):
+        self.root = root
+        self.data_version = data_version  # callable returning the current stamp
+        self.max_bytes = max_bytes
+        self.version_ttl = version_ttl
+        self._stamp = (None, float("-inf"))  # (stamp, checked_at)
+        self._lock = threading.Lock()
+        self._refreshing = threading.Lock()
+        self.counters = dict.fromkeys(["hits", "misses", "writes", "errors", "pruned"], 0)
+        os.makedirs(root, exist_ok=True)
+
+    def stamp(self):
+        stamp, checked_at = self._stamp
+        if time.monotonic() - checked_at < self.version_ttl:
+            return stamp
+        # One thread asks the database; the others keep using the last stamp meanwhile
+        if not self._refreshing.acquire(blocking=False):
+            return stamp
+        try:
+            if self._stamp[1] == checked_at:
+                try:
+                    stamp = str(self.data_version())
+                except Exception:
+                    stamp = None  # data version unknown: don't trust anything on disk
+                self._stamp = (stamp, time.monotonic())
+            return self._stamp[0]
+        finally:
+            self._refreshing.release()
+
+    def _path(self, key):
+        stamp = self.stamp()
+        if stamp is None:
+            return None
+        digest = hashlib.sha256(repr((stamp, key)).encode()).hexdigest()
+        return os.path.join(self.root, f"{digest}.parquet")
+
+    def get(self, key):
+        path = self._path(key)
+        if path is None or not os.path.exists(path):
+            self._count("misses")
+            return None
+        try:
+            df = pd.read_parquet(path)
+            os.utime(path)
+        except Exception:
+            self._count("errors")
+            return None
+        self._count("hits")
+        return df
+
+    def put(self, key, value):
+        if not isinstance(value, pd.DataFrame):
+            return
+        path = self._path(key)
+        if path is None:
+            return
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            value.to_parquet(tmp)
+            os.replace(tmp, path)
+        except Exception:
+            self._count("errors")
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            return
+        self._count("writes")
+        self.prune()
+
+    def prune(self):
+        with self._lock:
+            files = []
+            for entry in os.scandir(self.root):
+                if entry.name.endswith(".parquet"):
+                    st = entry.stat()
+                    files.append((st.st_mtime, st.st_size, entry.path))
+            total = sum(size for _, size, _ in files)
+            for _, size, path in sorted(files):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+                self.counters["pruned"] += 1
+
+    def _count(self, name):
+        with self._lock:
+            self.counters[name] += 1
+
+    def stats(self):
+        return {"root": self.root, "data_version": self._stamp[0], "max_bytes": self.max_bytes, **self.counters}
+
+
+# Every query_cache in the process, by the decorated function's module and
+# name: a module reloaded after a code change (Streamlit's file watcher)
+# keeps its caches, and clear_all() can reach them all.
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def clear_all():
+    # Empties every query_cache in the process (cold-start benchmarks)
+    with _caches_lock:
+        caches = list(_caches.values())
+    for cache in caches:
+        cache.clear()
+
+
+def query_cache(ttl=600.0, max_stale=3600.0, max_bytes=256 * 2**20, max_entries=None):
+    # Decorator form; the QueryCache is reachable as fn.cache for stats()/footprint()/clear()
+    def decorate(fn):
+        with _caches_lock:
+            cache = _caches.get((fn.__module__, fn.__qualname__))
+            if cache is None:
+                cache = _caches[(fn.__module__, fn.__qualname__)] = QueryCache(fn, ttl, max_stale, max_bytes, max_entries)
+            else:
+                # The reloaded function, keyed by its own signature; entries keyed by a different one are dropped
+                signature = inspect.signature(fn)
+                if signature != cache._signature:
+                    cache.clear()
+                cache.fn, cache._signature = fn, signature
+                cache.ttl, cache.max_stale = ttl, max(max_stale, ttl)
+                cache.max_bytes, cache.max_entries = max_bytes, max_entries
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            return cache(*args, **kwargs)
+
+        wrapper.cache = cache
+        return wrapper
+    return decorate
@@ -0,0 +1,61 @@
+import functools
+import importlib
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from setu import data
+from setu.metrics import metrics
+
+# The sidebar's chapters, in order: title -> module in this package with a
+# render(). A chapter's module, and whatever only it imports (Pillow for the
+# card grids, the search indexes, the scheme explorers), is loaded the first
+# time the chapter is opened, not at startup.
+CHAPTERS = {
+    "🏠 Home & Tourism Overview": "home",
+    "🎨 Traditional Art Forms": "art_forms",
+    "🏛️ Explore Cultural Destinations": "destinations",
+    "💰 Government Support & Schemes": "schemes",
+    "📅 Plan Your Visit (Seasonality)": "seasonality",
+    "💎 Untouched Cultural Gems": "gems",
+    "🌿 Responsible Tourism": "responsible",
+}
+
+
+def chapter(title):
+    # -> the chapter's module, imported on first use
+    return importlib.import_module(f"{__name__}.{CHAPTERS[title]}")
+
+
+def panel(name):
+    # An interactive panel as a st.fragment: a change to one of its widgets reruns just the panel, not the
+    # sidebar, the chapter around it or the other panels, so a panel reads its own data (store, cached queries).
+    # Each render is timed as a "panel" metric; run="panel" are the panel's own reruns, run="full" whole-script ones.
+    def decorate(render):
+        @functools.wraps(render)
+        def timed(*args, **kwargs):
+            ctx = get_script_run_ctx()
+            run = "panel" if ctx is not None and ctx.fragment_ids_this_run else "full"
+            with metrics.timer("panel", chapter=st.session_state.app_mode, panel=name, run=run):
+                render(*args, **kwargs)
+            if run == "panel" and data.metrics_prometheus_file:
+                # The end of the script, where full runs export, is not reached
+                metrics.write_prometheus(data.metrics_prometheus_file)
+        return st.fragment(timed)
+    return decorate
+
+
+def card_page(key, total, page_size):
+    # -> (page, pages) for the grid whose page number is session_state[key], clamped to the pages there are now
+    pages = max(1, -(-total // page_size))
+    return min(st.session_state.get(key, 0), pages - 1), pages
+
+
+def card_pager(key, page, pages):
+    # Previous / page x of y / Next under a card grid
+    def turn(step):
+        st.session_state[key] = page + step
+    col_prev, col_page, col_next = st.columns([1, 3, 1])
+    col_prev.button("◀ Previous", key=f"{key}_previous", disabled=page == 0, on_click=turn, args=(-1,), use_container_width=True)
+    col_page.caption(f"Page {page + 1} of {pages}")
+    col_next.button("Next ▶", key=f"{key}_next", disabled=page >= pages - 1, on_click=turn, args=(1,), use_container_width=True)
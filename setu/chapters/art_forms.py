@@ -0,0 +1,74 @@
+import pandas as pd
+import streamlit as st
+
+from setu import data, queries
+from setu.chapters import card_page, card_pager, panel
+from setu.data import run_query_df
+from setu.prefetch import prefetch
+
+# Traditional Art Forms: the catalogue as a filtered, paged grid of cards
+
+ART_PAGE_SIZE, ART_COLUMNS = 12, 3
+
+
+def render():
+    st.title("🎨 Discover India's Traditional Art Forms")
+    st.markdown("India's artistic heritage is a vibrant mosaic of myriad art forms, each telling a unique story of its region, culture, and people.")
+
+    # The filters and the pager rerun only this fragment (see panel())
+    @panel("art_forms")
+    def art_forms_panel():
+        try:
+            df_art_facets = data.store.get("art_form_facets")
+        
+            if not df_art_facets.empty:
+                states = sorted([s for s in df_art_facets['stateoforigin'].unique() if pd.notna(s)])
+                categories = sorted([c for c in df_art_facets['category'].unique() if pd.notna(c)])
+
+                def reset_art_page():
+                    st.session_state["art_page"] = 0
+
+                selected_state_art = st.selectbox("Filter by State:", ["All"] + states, key="art_state", on_change=reset_art_page)
+                selected_category_art = st.selectbox("Filter by Category:", ["All"] + categories, key="art_cat", on_change=reset_art_page)
+
+                # The filters and the page run in SQL; the per-(state, category) counts size the grid
+                matching_arts = df_art_facets
+                if selected_state_art != "All":
+                    matching_arts = matching_arts[matching_arts['stateoforigin'] == selected_state_art]
+                if selected_category_art != "All":
+                    matching_arts = matching_arts[matching_arts['category'] == selected_category_art]
+                art_page, art_pages = card_page("art_page", int(matching_arts['art_forms'].sum()), ART_PAGE_SIZE)
+                page_arts = run_query_df(data.conn, queries.ART_FORMS_PAGE, {
+                    "state": None if selected_state_art == "All" else selected_state_art,
+                    "category": None if selected_category_art == "All" else selected_category_art,
+                    "page_size": ART_PAGE_SIZE, "offset": art_page * ART_PAGE_SIZE,
+                })
+
+                if not page_arts.empty:
+                    # The page's thumbnails at once; only the first view of an image waits for its download
+                    art_images = prefetch(data.image_cache().thumbnail, {index: (url, 300) for index, url in page_arts['imageurl'].items()
+                                                                  if pd.notna(url) and url.strip()})
+                    for row_start in range(0, len(page_arts), ART_COLUMNS):
+                        for col_art, (index, row) in zip(st.columns(ART_COLUMNS), page_arts.iloc[row_start:row_start + ART_COLUMNS].iterrows()):
+                            with col_art.container(border=True):
+                                st.subheader(row['artformname'])
+                                if index in art_images:
+                                    art_image = art_images[index].result()
+                                    if art_image:
+                                        st.image(art_image, width=300, caption=f"{row['artformname']} from {row['stateoforigin']}")
+                                    else:
+                                        st.caption(f"Image not available for {row['artformname']}")
+                                st.markdown(f"**State of Origin:** {row['stateoforigin']}")
+                                st.markdown(f"**Category:** {row['category']}")
+                                st.write(row['briefdescription'])
+                                if pd.notna(row['responsibleconsumptiontip']):
+                                     st.info(f"💡 Responsible Tip: {row['responsibleconsumptiontip']}")
+                    card_pager("art_page", art_page, art_pages)
+                else:
+                    st.write("No art forms match your current filter.")
+            else:
+                st.write("No art form data available.")
+        except Exception as e:
+            st.error(f"Error loading art forms: {e}")
+
+    art_forms_panel()
@@ -0,0 +1,162 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from setu import data, indexes, queries, search
+from setu.chapters import panel
+from setu.growth import growth, growth_labels
+from setu.metrics import metrics
+
+# Explore Cultural Destinations: rising monuments and the per-monument drill-down
+
+
+def render():
+    st.title("🏛️ Explore Cultural Destinations")
+    st.markdown("From ancient monuments to vibrant states, discover India's key cultural hotspots.")
+    
+    tab1, tab2 = st.tabs(["Rising Popularity - Monuments", "Iconic Monuments (Detailed Trends)"])
+
+    with tab1: 
+        st.subheader("Monuments with Rising Visitor Interest")
+        st.markdown("Identifying monuments (not in the absolute Top 10 of that year) showing significant growth in total visitors.")
+
+        @panel("rising_monuments")
+        def rising_monuments_panel():
+            try:
+                df_monument_fys = data.store.get("monument_fys")
+                if not df_monument_fys.empty:
+                    # A lookup in the precomputed growth summary (python -m setu.summaries), for any financial year
+                    rising_fy = st.selectbox("Financial year:", df_monument_fys['financial_year_range'].tolist(), key="rising_mon_period")
+                    rising_mon_min_growth, rising_mon_n = 20, 7
+                    df_rising_monuments = data.run_summary_df(queries.RISING_MONUMENTS,
+                                                              {"period": rising_fy, "min_growth": rising_mon_min_growth, "max_rows": rising_mon_n})
+
+                    df_rising_monuments['total_growth_pct_calculated'] = growth_labels(growth(df_rising_monuments['total_visitors_fy_end'], df_rising_monuments['total_visitors_fy_start']))
+
+                    if not df_rising_monuments.empty:
+                        st.write(f"Emerging monument destinations based on total visitor growth ({rising_fy.split('-')[0]} to {rising_fy.split('-')[1]}):")
+                    
+                        rising_mon_visitor_type = st.radio(
+                            "Show visitor trends for:", 
+                            ("Domestic Visitors", "Foreign Visitors"), 
+                            key="rising_mon_visitor_type_global", 
+                            horizontal=True
+                        )
+
+                        for index, row_mon_star in df_rising_monuments.iterrows():
+                            st.markdown(f"#### {row_mon_star['monument_name']} ({row_mon_star['circle']})")
+                        
+                            delta_val_mon = row_mon_star['total_growth_pct_calculated']
+                            delta_display_mon = delta_val_mon if delta_val_mon not in ["N/A", "0.00%"] else None
+                                                    
+                            st.metric(label=f"Total Visitors ({rising_fy.split('-')[1]})", 
+                                      value=f"{int(row_mon_star['total_visitors_fy_end']):,}", 
+                                      delta=delta_display_mon)
+                        
+                            fy_start_label = rising_fy.split('-')[0]
+                            fy_end_label = rising_fy.split('-')[1]
+
+                            if rising_mon_visitor_type == "Domestic Visitors":
+                                visitors_start = row_mon_star['domestic_visitors_fy_start']
+                                visitors_end = row_mon_star['domestic_visitors_fy_end']
+                                chart_title = "Domestic Visitors"
+                            else: 
+                                visitors_start = row_mon_star['foreign_visitors_fy_start']
+                                visitors_end = row_mon_star['foreign_visitors_fy_end']
+                                chart_title = "Foreign Visitors"
+                        
+                            chart_data_mon = pd.DataFrame({
+                                'Financial Year': [fy_start_label, fy_end_label],
+                                chart_title: [visitors_start, visitors_end]
+                            })
+                            st.bar_chart(chart_data_mon.set_index('Financial Year')[chart_title], use_container_width=True)
+                            st.caption(f"Data for chart: {chart_title} - {fy_start_label}: {int(visitors_start):,}, {fy_end_label}: {int(visitors_end):,}")
+                            st.markdown("---")
+                    else:
+                        st.write(f"Could not identify significant rising monuments (with >{rising_mon_min_growth}% growth) outside the Top 10 for that year.")
+                else:
+                    st.write("No financial years of monument data available.")
+            except Exception as e:
+                st.error(f"Error loading rising popularity for monuments: {e}")
+
+        rising_monuments_panel()
+
+    with tab2:
+        st.subheader("Iconic Monuments & Detailed Visitor Trends")
+        try:
+            df_top10_dom_detail = data.store.get("top10_domestic_monuments_fy2022_23")
+            if not df_top10_dom_detail.empty:
+                df_top10_dom_detail.index = np.arange(1, len(df_top10_dom_detail) + 1)
+                st.write("Top ASI Monuments by Domestic Visitors (FY 2022-23):")
+                st.dataframe(df_top10_dom_detail)
+            else:
+                st.write("Top 10 domestic monument data for FY2022-23 not available.")
+        except Exception as e:
+            st.error(f"Error loading top 10 monuments data: {e}")
+
+        st.markdown("---")
+        st.subheader("Detailed Monument Visitor Trends (Year-on-Year)")
+
+        @panel("monument_trends")
+        def monument_trends_panel():
+            try:
+                # circle -> monument -> yearly figures, built once per data refresh: no queries per selection
+                monument_trends = data.store.derive("monument_trends", indexes.monument_trends)
+                if monument_trends:
+                    # Fuzzy search over every circle's monuments; picking a result fills in both selectboxes below
+                    def show_monument_trends(circle, monument):
+                        st.session_state["mon_circle_select_detail"] = circle
+                        st.session_state["mon_name_select_detail"] = monument
+
+                    monument_search = data.store.derive("monument_search", search.monument_search)
+                    monument_query = st.text_input("Search monuments across all circles:", key="mon_search", placeholder="e.g. Taj Mahal, Konark, Ellora")
+                    if monument_query:
+                        with metrics.timer("transform", chapter="destinations", stage="monument_search"):
+                            monument_matches = monument_search.search(monument_query, limit=8)
+                        if monument_matches:
+                            for _, (match_circle, match_monument) in monument_matches:
+                                st.button(f"{match_monument} ({match_circle})", key=f"mon_search_{match_circle}_{match_monument}",
+                                          on_click=show_monument_trends, args=(match_circle, match_monument))
+                        else:
+                            st.caption(f"No monuments match '{monument_query}'.")
+
+                    selected_circle = st.selectbox("Select ASI Circle:", list(monument_trends), key="mon_circle_select_detail")
+                    if selected_circle:
+                        monuments_in_circle = monument_trends.get(selected_circle, {})
+                        if monuments_in_circle:
+                            selected_monument = st.selectbox("Select Monument:", list(monuments_in_circle), key="mon_name_select_detail")
+                            if selected_monument:
+                                df_monument_detail = pd.DataFrame(monuments_in_circle[selected_monument])
+                                if not df_monument_detail.empty:
+                                    st.write(f"Visitor Statistics for {selected_monument}:")
+                                    domestic_growth = growth_labels(growth(df_monument_detail['domestic_visitors_fy_end'], df_monument_detail['domestic_visitors_fy_start']))
+                                    foreign_growth = growth_labels(growth(df_monument_detail['foreign_visitors_fy_end'], df_monument_detail['foreign_visitors_fy_start']))
+                                    for idx, row_detail in df_monument_detail.iterrows():
+                                        st.markdown(f"**Data for: {row_detail['financial_year_range']}**")
+                                        dom_start = row_detail['domestic_visitors_fy_start']
+                                        dom_end = row_detail['domestic_visitors_fy_end']
+                                        for_start = row_detail['foreign_visitors_fy_start']
+                                        for_end = row_detail['foreign_visitors_fy_end']
+
+                                        domestic_growth_calculated = domestic_growth[idx]
+                                        foreign_growth_calculated = foreign_growth[idx]
+                                    
+                                        col1_mon, col2_mon = st.columns(2)
+                                        with col1_mon:
+                                            st.metric(f"Domestic Visitors ({row_detail['financial_year_range'].split('-')[0]})", f"{int(dom_start):,}" if pd.notna(dom_start) else "N/A")
+                                            st.metric(f"Domestic Visitors ({row_detail['financial_year_range'].split('-')[1]})", f"{int(dom_end):,}" if pd.notna(dom_end) else "N/A", delta=domestic_growth_calculated if domestic_growth_calculated not in ["0.00%", "N/A"] else None)
+                                        with col2_mon:
+                                            st.metric(f"Foreign Visitors ({row_detail['financial_year_range'].split('-')[0]})", f"{int(for_start):,}" if pd.notna(for_start) else "N/A")
+                                            st.metric(f"Foreign Visitors ({row_detail['financial_year_range'].split('-')[1]})", f"{int(for_end):,}" if pd.notna(for_end) else "N/A", delta=foreign_growth_calculated if foreign_growth_calculated not in ["0.00%", "N/A"] else None)
+                                        st.caption("Growth calculated based on start and end year figures. 'New Growth' indicates start year was zero.")
+                                        st.markdown("---")
+                                else:
+                                     st.write(f"No detailed trend data found for {selected_monument}.")
+                        else:
+                            st.write(f"No monuments found for circle: {selected_circle}")
+                else:
+                    st.write("No ASI circles found in the data.")
+            except Exception as e:
+                st.error(f"Error loading detailed monument data: {e}")
+
+        monument_trends_panel()
@@ -0,0 +1,51 @@
+import pandas as pd
+import streamlit as st
+
+from setu import data, queries
+from setu.chapters import card_page, card_pager, panel
+from setu.data import run_query_df
+from setu.prefetch import prefetch
+
+# Untouched Cultural Gems: a paged grid of cards
+
+GEM_PAGE_SIZE, GEM_COLUMNS = 6, 2
+
+
+def render():
+    st.title("💎 Discover Untouched Cultural Gems")
+    st.markdown("Explore some of India's lesser-known destinations that offer rich cultural experiences, and learn how to visit them responsibly.")
+
+    @panel("untouched_gems")
+    def untouched_gems_panel():
+        try:
+            df_gem_count = data.store.get("untouched_gem_count")
+            gem_page, gem_pages = card_page("gem_page", int(df_gem_count['gems'].sum()), GEM_PAGE_SIZE)
+            page_gems = run_query_df(data.conn, queries.UNTOUCHED_GEMS_PAGE, {"page_size": GEM_PAGE_SIZE, "offset": gem_page * GEM_PAGE_SIZE})
+        
+            if not page_gems.empty:
+                gem_images = prefetch(data.image_cache().thumbnail, {index: (url, 400) for index, url in page_gems['imageurl'].items()
+                                                              if pd.notna(url) and url.strip()})
+                for row_start in range(0, len(page_gems), GEM_COLUMNS):
+                    for col_gem, (index, row) in zip(st.columns(GEM_COLUMNS), page_gems.iloc[row_start:row_start + GEM_COLUMNS].iterrows()):
+                        with col_gem.container(border=True):
+                            st.subheader(row['gemname'])
+                            if index in gem_images:
+                                gem_image = gem_images[index].result()
+                                if gem_image:
+                                    st.image(gem_image, caption=row['gemname'], width=400)
+                                else:
+                                    st.caption(f"Could not load image for {row['gemname']}.")
+                            else:
+                                st.caption(f"Image not available for {row['gemname']}.")
+
+                            st.markdown(f"**State:** {row['state']} | **Region:** {row['region']} | **Type:** {row['type']}")
+                            st.write(f"**Cultural Significance:** {row['culturalsignificance']}")
+                            st.info(f"**Why Potentially Untouched?** {row['whypotentiallyuntouched']}")
+                            st.success(f"🌿 **Responsible Travel Guideline:** {row['responsibletravelguideline']}")
+                card_pager("gem_page", gem_page, gem_pages)
+            else:
+                st.write("No untouched gems data available.")
+        except Exception as e:
+            st.error(f"Error loading untouched gems: {e}")
+
+    untouched_gems_panel()
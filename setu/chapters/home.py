@@ -0,0 +1,100 @@
+import numpy as np
+import streamlit as st
+
+from setu import data, indexes, queries
+from setu.chapters import panel
+from setu.growth import growth, growth_labels
+
+# Home & Tourism Overview: the year's top 10 states and the rising ones
+
+
+def render():
+    st.title("Welcome to Sanskriti Setu!")
+    st.markdown("Your smart gateway to India's rich cultural tapestry. Discover traditional arts, explore vibrant cultural experiences, and learn about responsible tourism.")
+    st.markdown("---")
+    st.header("India Tourism Snapshot")
+
+    # Each panel is a fragment (see panel()): its widgets rerun the panel alone, which reads its own data
+    @panel("top_states")
+    def top_states_panel():
+        try:
+            # Already-sorted top 10 per (year, visitor type), built once per data refresh for all sessions
+            top_states_home = data.store.derive("top_states", indexes.top_states)
+            available_years = sorted({year for year, _ in top_states_home}, reverse=True)
+
+            col1_home, col2_home = st.columns(2)
+            with col1_home:
+                selected_year_home = st.selectbox("Select Year for Top States:", available_years, key="home_year_select")
+            with col2_home:
+                visitor_type_home = st.selectbox("View by:", ["Domestic Visitors", "Foreign Visitors"], key="home_visitor_type")
+
+            st.subheader(f"Top 10 States by {visitor_type_home} ({selected_year_home})")
+            df_top10_home = top_states_home.get((selected_year_home, visitor_type_home))
+
+            if df_top10_home is not None:
+                display_column_name_home = f"{visitor_type_home} ({selected_year_home})"
+                
+                df_display_top10_home = df_top10_home.copy()
+                df_display_top10_home.columns = ["State/UT", display_column_name_home]
+                df_display_top10_home.index = np.arange(1, len(df_display_top10_home) + 1) 
+                st.dataframe(df_display_top10_home)
+                st.bar_chart(df_display_top10_home.set_index("State/UT")[display_column_name_home])
+            else:
+                st.write(f"No data available for the year {selected_year_home}.")
+        except Exception as e:
+            st.error(f"An error occurred while fetching and processing state tourism data: {e}")
+
+    @panel("rising_states")
+    def rising_states_panel():
+        try:
+            available_years = sorted({year for year, _ in data.store.derive("top_states", indexes.top_states)}, reverse=True)
+            # A lookup in the precomputed growth summary (python -m setu.summaries), for any period
+            rising_period = st.selectbox("Growth up to year:", available_years, key="home_rising_period")
+            rising_min_growth, rising_top_n, rising_n = 10, 10, 5
+            df_rising_stars = data.run_summary_df(queries.RISING_STATES,
+                                                  {"period": rising_period, "min_growth": rising_min_growth, "top_n": rising_top_n, "rising_n": rising_n})
+            # Display strings only for the rows shown
+            df_rising_stars['total_growth_pct_calculated'] = growth_labels(growth(df_rising_stars['total_visitors_yr2'], df_rising_stars['total_visitors_yr1']))
+
+            if not df_rising_stars.empty:
+                data_period_yr1_rising = df_rising_stars['data_period_yr1'].iloc[0]
+                data_period_yr2_rising = df_rising_stars['data_period_yr2'].iloc[0]
+                st.write(f"Emerging destinations based on total visitor growth from {data_period_yr1_rising} to {data_period_yr2_rising} (Min. {rising_min_growth}% growth, outside Top {rising_top_n}):")
+                for index, row_star in df_rising_stars.iterrows():
+                    delta_val = row_star['total_growth_pct_calculated']
+                    delta_display = delta_val if delta_val not in ["N/A", "0.00%"] else None 
+                    st.metric(label=row_star["state_ut"], 
+                              value=f"{int(row_star['total_visitors_yr2']):,} visits", 
+                              delta=delta_display)
+                df_rising_display = df_rising_stars[['state_ut', 'total_visitors_yr1', 'total_visitors_yr2', 'total_growth_pct_calculated']].copy()
+                df_rising_display.columns = ["State/UT", f"Total Visits ({data_period_yr1_rising})", f"Total Visits ({data_period_yr2_rising})", "Overall Growth"]
+                df_rising_display.index = np.arange(1, len(df_rising_display) + 1)
+                st.dataframe(df_rising_display)
+            else:
+                st.write(f"Could not identify significant rising stars (with >{rising_min_growth}% growth) outside the top {rising_top_n}, or data insufficient.")
+        except Exception as e:
+            st.error(f"An error occurred while fetching and processing state tourism data: {e}")
+
+    try:
+        top_states_home = data.store.derive("top_states", indexes.top_states)
+
+        if top_states_home:
+            available_years = sorted({year for year, _ in top_states_home}, reverse=True)
+            
+            if not available_years:
+                st.warning("No years available for selection in State Tourism Data.")
+            else:
+                top_states_panel()
+
+            st.markdown("---")
+            st.header("States with Rising Tourism Popularity")
+            st.markdown("Highlighting states (not in that year's Top 10 by total visits) showing significant overall growth in total visitors.")
+
+            if available_years:
+                rising_states_panel()
+            else:
+                st.write("Latest year data not available for rising popularity analysis.")
+        else:
+            st.write("State tourism data could not be loaded.")
+    except Exception as e:
+        st.error(f"An error occurred while fetching and processing state tourism data: {e}")
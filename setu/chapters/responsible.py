@@ -0,0 +1,21 @@
+import streamlit as st
+
+# Responsible Tourism: static guidance, no data
+
+
+def render():
+    st.title("🌿 Travel Responsibly, Preserve Our Heritage")
+    st.markdown("""
+    Responsible tourism is about making better places for people to live in and better places for people to visit. It focuses on minimizing negative environmental, social, and economic impacts while generating greater economic benefits for local people and enhancing the well-being of host communities.
+    """)
+    st.subheader("Key Principles for Responsible Travellers in India:")
+    st.markdown("""
+    * **Respect Local Culture & Traditions:** Learn a few basic phrases, dress modestly especially when visiting religious sites, and always ask for permission before taking photographs of people or their property.
+    * **Support Local Economies:** Buy authentic souvenirs directly from artisans, eat at local restaurants, and use local guides. Ensure your spending benefits the host community.
+    * **Protect Heritage Sites:** Do not deface, damage, or remove anything from historical monuments or natural sites. Follow designated paths and respect entry restrictions.
+    * **Minimize Environmental Impact:** Reduce plastic use (carry reusable water bottles/bags), dispose of waste properly, conserve water and electricity. Choose eco-friendly accommodations and transport where possible.
+    * **Be Mindful of Wildlife:** Do not feed wild animals, maintain a safe distance, and avoid disturbing their natural habitat. Opt for ethical wildlife tourism operators.
+    * **Reduce Overcrowding:** Consider visiting popular sites during off-peak seasons or times. Explore lesser-known destinations to help distribute tourist flow.
+    * **Stay Informed:** Research your destination, understand local sensitivities, and be aware of any specific guidelines for visitors.
+    * **Provide Constructive Feedback:** If you encounter practices that are not responsible, provide polite feedback to the concerned authorities or businesses.
+    """)
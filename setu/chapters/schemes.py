@@ -0,0 +1,313 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from setu import data, queries
+from setu.chapters import panel
+from setu.data import run_query_df
+from setu.metrics import metrics
+
+# Government Support & Schemes: national funding, the artist scheme overview
+# and an explorer over each scheme's own data
+
+
+def render():
+    st.title("💰 Government Support for Arts & Culture")
+    st.markdown("Explore various schemes and financial assistance provided by the government to promote and preserve India's cultural heritage and support its artists.")
+
+    # The explorers with widgets of their own are fragments inside the scheme explorer's fragment,
+    # so their widgets rerun only the explorer shown
+    @panel("syas_beneficiaries")
+    def syas_panel(selected_specific_scheme_display):
+        try:
+            st.markdown("##### Senior/Young Artist Scheme Beneficiary Data")
+            df_syas_counts = data.store.get("syas_state_counts")
+
+            if not df_syas_counts.empty:
+                # Filter, page and counts all run in the database: a page is the next
+                # syas_page_size rows after the last row of the previous one, and the
+                # session keeps, per filter, where each page it has passed ended.
+                syas_page_size = 50
+
+                def reset_syas_pages():
+                    st.session_state["syas_page_starts"] = {}
+
+                def next_syas_page(state_filter, last_row):
+                    st.session_state.setdefault("syas_page_starts", {}).setdefault(state_filter, []).append(last_row)
+
+                def previous_syas_page(state_filter):
+                    st.session_state["syas_page_starts"][state_filter].pop()
+
+                selected_state_syas_tab3 = st.selectbox("Filter by State:", ["All"] + df_syas_counts['state'].tolist(),
+                                                        key="syas_state_filter_tab3", on_change=reset_syas_pages)
+                syas_page_starts = st.session_state.get("syas_page_starts", {}).get(selected_state_syas_tab3, [])
+                after_state, after_age, after_user_id = syas_page_starts[-1] if syas_page_starts else (None, None, None)
+                # One row past the page tells whether there is a next one
+                syas_params = {"after_age": after_age, "after_user_id": after_user_id, "page_size": syas_page_size + 1}
+                if selected_state_syas_tab3 == "All":
+                    df_counts_filtered = df_syas_counts
+                    df_syas_page = run_query_df(data.conn, queries.SYAS_PAGE, {**syas_params, "after_state": after_state})
+                else:
+                    df_counts_filtered = df_syas_counts[df_syas_counts['state'] == selected_state_syas_tab3]
+                    df_syas_page = run_query_df(data.conn, queries.SYAS_STATE_PAGE, {**syas_params, "state": selected_state_syas_tab3})
+
+                has_next_page = len(df_syas_page) > syas_page_size
+                df_syas_page = df_syas_page.head(syas_page_size)
+                first_row = len(syas_page_starts) * syas_page_size + 1
+                total_syas = int(df_counts_filtered['beneficiaries'].sum())
+
+                display_cols_syas = ['state', 'subject', 'gender', 'age', 'phy_handicaped']
+                df_display_table_syas = df_syas_page[display_cols_syas].copy()
+                df_display_table_syas.index = np.arange(first_row, first_row + len(df_display_table_syas))
+                st.dataframe(df_display_table_syas)
+
+                col_prev, col_range, col_next = st.columns([1, 3, 1])
+                col_prev.button("◀ Previous", key="syas_previous_page", disabled=not syas_page_starts,
+                                on_click=previous_syas_page, args=(selected_state_syas_tab3,), use_container_width=True)
+                if not df_syas_page.empty:
+                    col_range.caption(f"Beneficiaries {first_row:,}–{first_row + len(df_syas_page) - 1:,} of {total_syas:,}")
+                    last = df_syas_page.iloc[-1]
+                    last_row = (last['state'], int(last['age']), int(last['user_id']))
+                else:
+                    last_row = None
+                col_next.button("Next ▶", key="syas_next_page", disabled=not has_next_page,
+                                on_click=next_syas_page, args=(selected_state_syas_tab3, last_row), use_container_width=True)
+
+                if total_syas:
+                    st.markdown("###### Summary Charts")
+                    
+                    st.markdown("Distribution of Beneficiaries by State (Selected Filter):")
+                    beneficiaries_by_state_filtered = df_counts_filtered.rename(columns={'beneficiaries': 'Number of Beneficiaries'}).sort_values(by='Number of Beneficiaries', ascending=False, kind='stable')
+                    st.bar_chart(beneficiaries_by_state_filtered.head(15).set_index('state'))
+
+            else: 
+                st.write(f"No data available for {selected_specific_scheme_display}.")
+        except Exception as e:
+            st.error(f"An error occurred while fetching data for {selected_specific_scheme_display}: {e}")
+
+    @panel("guru_shishya_trends")
+    def guru_shishya_panel(selected_specific_scheme_display):
+        try:
+            st.markdown("##### Guru-Shishya Parampara Assistance (Amount in Lakhs)")
+            df_data = data.store.get("gurushishyaparamparaassistance")
+            if not df_data.empty:
+                df_data.columns = ["State/UT", "Amount 21-22", "Amount 22-23", "Amount 23-24 (Released/Authorized)"]
+                amount_cols = ["Amount 21-22", "Amount 22-23", "Amount 23-24 (Released/Authorized)"]
+                unique_states_gsp = sorted([s for s in df_data['State/UT'].unique() if pd.notna(s)])
+                selected_states_gsp = st.multiselect("Select State(s) to view trend:", unique_states_gsp, default=unique_states_gsp[:min(3, len(unique_states_gsp))], key="gsp_state_multiselect_revised")
+
+                if selected_states_gsp:
+                    df_filtered_gsp = df_data[df_data['State/UT'].isin(selected_states_gsp)]
+                    df_melted_gsp = df_filtered_gsp.melt(id_vars=['State/UT'], value_vars=amount_cols, var_name='Financial Year Period', value_name='Amount (Lakhs)')
+                    df_melted_gsp['Financial Year Period'] = df_melted_gsp['Financial Year Period'].str.replace("Amount ", "").str.replace(" (Released/Authorized)", "").str.replace(" (Auth/Rel)", "") 
+                    st.line_chart(df_melted_gsp.pivot_table(index='Financial Year Period', columns='State/UT', values='Amount (Lakhs)', aggfunc='sum', observed=True).fillna(0))
+                else:
+                    st.info("Select one or more states to display the trend chart.")
+                df_data.index = np.arange(1, len(df_data) + 1)
+                st.dataframe(df_data)
+            else: st.write(f"No data available for {selected_specific_scheme_display}.")
+        except Exception as e:
+            st.error(f"An error occurred while fetching data for {selected_specific_scheme_display}: {e}")
+
+    @panel("cultural_function_trends")
+    def cultural_function_panel(selected_specific_scheme_display):
+        try:
+            st.markdown("##### Cultural Function & Production Grants (Amount in Lakhs)")
+            df_data = data.store.get("culturalfunctionproductiongrant")
+            if not df_data.empty:
+                df_data.columns = ["State/UT", "Amount 21-22", "Amount 22-23", "Amount 23-24 (Released)"]
+                amount_cols_cfp = ["Amount 21-22", "Amount 22-23", "Amount 23-24 (Released)"]
+                unique_states_cfp = sorted([s for s in df_data['State/UT'].unique() if pd.notna(s)])
+                selected_states_cfp = st.multiselect("Select State(s) to view trend:", unique_states_cfp, default=unique_states_cfp[:min(3, len(unique_states_cfp))], key="cfp_state_multiselect_revised")
+
+                if selected_states_cfp:
+                    df_filtered_cfp = df_data[df_data['State/UT'].isin(selected_states_cfp)]
+                    df_melted_cfp = df_filtered_cfp.melt(id_vars=['State/UT'], value_vars=amount_cols_cfp, var_name='Financial Year Period', value_name='Amount (Lakhs)')
+                    df_melted_cfp['Financial Year Period'] = df_melted_cfp['Financial Year Period'].str.replace("Amount ", "").str.replace(" (Released)", "")
+                    st.line_chart(df_melted_cfp.pivot_table(index='Financial Year Period', columns='State/UT', values='Amount (Lakhs)', aggfunc='sum', observed=True).fillna(0))
+                else:
+                    st.info("Select one or more states to display the trend chart.")
+                df_data.index = np.arange(1, len(df_data) + 1)
+                st.dataframe(df_data)
+            else: st.write(f"No data available for {selected_specific_scheme_display}.")
+        except Exception as e:
+            st.error(f"An error occurred while fetching data for {selected_specific_scheme_display}: {e}")
+
+    @panel("museum_grants")
+    def museum_grants_panel(selected_specific_scheme_display):
+        try:
+            st.markdown("##### Museum Development Grants (Funds Released)")
+            df_data = data.store.get("museumgrantschemefunds")
+            if not df_data.empty:
+                fund_cols_db = ['funds_2019_20', 'funds_2020_21', 'funds_2021_22', 'funds_2022_23', 'funds_2023_24']
+                fund_cols_display = ['2019-20', '2020-21', '2021-22', '2022-23', '2023-24']
+                fund_cols_map = dict(zip(fund_cols_db, fund_cols_display))
+
+                unique_states_museum = sorted([s for s in df_data['state_name'].unique() if pd.notna(s)])
+                selected_states_museum = st.multiselect("Select State(s):", unique_states_museum, default=unique_states_museum[:min(3, len(unique_states_museum))], key="museum_state_multiselect_revised")
+                
+                selected_year_museum_display = st.selectbox("Select Year to View Funds:", fund_cols_display, key="museum_year_select_revised")
+
+                selected_year_db_col = [k for k, v in fund_cols_map.items() if v == selected_year_museum_display][0]
+
+                if selected_states_museum and selected_year_museum_display:
+                    df_filtered_museum = df_data[df_data['state_name'].isin(selected_states_museum)]
+                    st.bar_chart(df_filtered_museum.groupby('state_name', observed=True)[selected_year_db_col].sum())
+                
+                df_data.index = np.arange(1, len(df_data) + 1)
+                st.dataframe(df_data)
+            else: st.write(f"No data available for {selected_specific_scheme_display}.")
+        except Exception as e:
+            st.error(f"An error occurred while fetching data for {selected_specific_scheme_display}: {e}")
+
+    tab_overall_funding, tab_artist_overview, tab_explore_grants = st.tabs([
+        "Overall Scheme Funding (National)", 
+        "Artist Support Schemes Overview", 
+        "Explore Specific Scheme Grants"
+    ])
+
+    with tab_overall_funding:
+        st.subheader("Overall Scheme-wise Funds Released (National Level)")
+        st.markdown("Funding trends for major cultural schemes over the years (Amounts in Crores).")
+
+        @panel("overall_funds")
+        def overall_funds_panel():
+            try:
+                df_overall_funds = data.store.get("schemewisefundsreleased")
+                if not df_overall_funds.empty:
+
+                    with metrics.timer("transform", chapter="schemes", stage="overall_funds_melt"):
+                        df_overall_funds.columns = ["Scheme Name", "2019-20", "2020-21", "2021-22", "2022-23", "2023-24"]
+                
+                        df_melted_overall_funds = df_overall_funds.melt(id_vars=['Scheme Name'], var_name='Financial Year', value_name='Funds Released (Crores)')
+                
+                    if not df_melted_overall_funds.empty:
+                        all_schemes = sorted(df_melted_overall_funds['Scheme Name'].unique())
+                        selected_schemes_plot = st.multiselect("Select schemes to plot:", all_schemes, default=all_schemes[:min(5, len(all_schemes))], key="worm_plot_schemes")
+
+                        if selected_schemes_plot:
+                            df_plot_funds = df_melted_overall_funds[df_melted_overall_funds['Scheme Name'].isin(selected_schemes_plot)]
+                            st.line_chart(df_plot_funds.pivot_table(index='Financial Year', columns='Scheme Name', values='Funds Released (Crores)', aggfunc='sum').fillna(0))
+                        else:
+                            st.info("Select one or more schemes to display the trend chart.")
+                
+                    df_overall_funds.index = np.arange(1, len(df_overall_funds) + 1)
+                    st.dataframe(df_overall_funds)
+                else:
+                    st.write("No data available for Overall Scheme Funding.")
+            except Exception as e:
+                st.error(f"Error loading Overall Scheme Funding data: {e}")
+
+        overall_funds_panel()
+
+    with tab_artist_overview:
+        st.subheader("Artist Support Schemes Overview")
+        st.markdown("Descriptive overview of various schemes aimed at supporting artists and cultural practices.")
+        try:
+            df_summary = data.store.get("artistsupportschemesummary")
+            if not df_summary.empty:
+                for index, row in df_summary.iterrows():
+                    st.markdown(f"#### {row['schemename']}")
+                    with st.expander("Details", expanded=False):
+                        st.markdown(f"**Administering Body:** {row['administeringbody']}")
+                        st.markdown(f"**Focus Area:** {row['focusarea']}")
+                        if pd.notna(row['datapoint_example_state_ut']) and pd.notna(row['datapoint_example_value']):
+                            st.markdown(f"**Impact:** {row['datapoint_example_value']} in {row['datapoint_example_state_ut']}")
+                        st.write(f"**Relevance to Platform:** {row['relevancetoplatform']}")
+                    st.markdown("---")
+            else: 
+                st.write("No data for Artist Support Schemes Overview.")
+        except Exception as e:
+            st.error(f"Error loading Artist Support Schemes Overview: {e}")
+
+    with tab_explore_grants:
+        st.subheader("Explore Specific Scheme Grants & Data")
+
+        @panel("scheme_explorer")
+        def scheme_explorer_panel():
+            # Lowercase table names for PostgreSQL
+            specific_scheme_table_map = {
+                "Senior/Young Artist Scheme (Beneficiaries)": "senioryoungartistscheme",
+                "Building Grants (Studio Theatre)": "buildinggrantsstudiotheatre",
+                "Veteran Artists (Applications Received)": "veteranartistsapplications",
+                "Guru-Shishya Parampara (Assistance)": "gurushishyaparamparaassistance",
+                "Cultural Function & Production Grants": "culturalfunctionproductiongrant",
+                "Museum Development Grants": "museumgrantschemefunds",
+                "ASI Monument Preservation Expenditure (National)": "asimonumentpreservationexpenditure"
+            }
+            selected_specific_scheme_display = st.selectbox("Select Specific Scheme/Grant Data:", list(specific_scheme_table_map.keys()), key="specific_scheme_select_tab3")
+            selected_specific_table = specific_scheme_table_map[selected_specific_scheme_display]
+
+            try:
+                full_table_name = f"tourism_data.{selected_specific_table}"
+
+                if selected_specific_table == "senioryoungartistscheme":
+                    syas_panel(selected_specific_scheme_display)
+            
+                elif selected_specific_table == "buildinggrantsstudiotheatre":
+                    st.markdown("##### Building Grants including Studio Theatre (Amount in Lakhs)")
+                    df_data = data.store.get(selected_specific_table)
+                    if not df_data.empty:
+                        df_data.columns = ["State/UT", "Amount 21-22", "Amount 22-23", "Amount 23-24"]
+                        df_melted = df_data.melt(id_vars=['State/UT'], var_name='Financial Year', value_name='Amount (Lakhs)')
+                        pivot_data = df_melted.pivot_table(index='State/UT', columns='Financial Year', values='Amount (Lakhs)', aggfunc='sum', observed=True).fillna(0)
+                        st.bar_chart(pivot_data)
+                        df_data.index = np.arange(1, len(df_data) + 1)
+                        st.dataframe(df_data)
+                    else: st.write(f"No data available for {selected_specific_scheme_display}.")
+
+                elif selected_specific_table == "veteranartistsapplications":
+                    st.markdown("##### Applications for Veteran Artists Financial Assistance")
+                    df_data = data.store.get(selected_specific_table)
+                    if not df_data.empty:
+                        df_data.columns = ["State/UT", "Apps 19-20", "Apps 20-21", "Apps 21-22", "Apps 22-23", "Apps 23-24"]
+                        latest_year_col_vaa = "Apps 23-24" 
+                        st.bar_chart(df_data.sort_values(by=latest_year_col_vaa, ascending=False).head(15).set_index('State/UT')[latest_year_col_vaa])
+                        df_data.index = np.arange(1, len(df_data) + 1)
+                        st.dataframe(df_data)
+                    else: st.write(f"No data for {selected_specific_scheme_display}.")
+            
+                elif selected_specific_table == "gurushishyaparamparaassistance":
+                    guru_shishya_panel(selected_specific_scheme_display)
+
+                elif selected_specific_table == "culturalfunctionproductiongrant":
+                    cultural_function_panel(selected_specific_scheme_display)
+
+                elif selected_specific_table == "museumgrantschemefunds":
+                    museum_grants_panel(selected_specific_scheme_display)
+            
+                elif selected_specific_table == "asimonumentpreservationexpenditure":
+                    st.markdown("##### ASI Monument Preservation Expenditure (National Level, Amount in Crores)")
+                    df_asi_exp = data.store.get(selected_specific_table)
+                    if not df_asi_exp.empty:
+                        df_asi_exp.columns = ["Financial Year", "Allocation (Crores)", "Expenditure (Crores)"]
+                        st.line_chart(df_asi_exp.set_index("Financial Year"))
+                        df_asi_exp.index = np.arange(1, len(df_asi_exp) + 1)
+                        st.dataframe(df_asi_exp)
+                    else: st.write(f"No data for {selected_specific_scheme_display}.")
+            
+                else: # Fallback for any other table
+                    st.markdown(f"##### Data for: {selected_specific_scheme_display}")
+                    try:
+                        # Generic, safe query
+                        query = f"SELECT * FROM {full_table_name} LIMIT 200;"
+                        df_generic_scheme = run_query_df(data.conn, query)
+                    
+                        if not df_generic_scheme.empty:
+                            # Post-filter in pandas if columns exist
+                            if 'state_ut' in df_generic_scheme.columns:
+                                df_generic_scheme = df_generic_scheme[~df_generic_scheme['state_ut'].astype(str).str.contains('Total', na=False, case=False)]
+                            elif 'scheme_name' in df_generic_scheme.columns:
+                                 df_generic_scheme = df_generic_scheme[~df_generic_scheme['scheme_name'].astype(str).str.contains('Total', na=False, case=False)]
+
+                            df_generic_scheme.index = np.arange(1, len(df_generic_scheme) + 1)
+                            st.dataframe(df_generic_scheme)
+                        else:
+                            st.write(f"No data available for: {selected_specific_scheme_display}.")
+                    except Exception as e:
+                        st.error(f"An error occurred while fetching generic data for {selected_specific_scheme_display}: {e}")
+
+            except Exception as e:
+                st.error(f"An error occurred while fetching data for {selected_specific_scheme_display}: {e}")
+
+        scheme_explorer_panel()
@@ -0,0 +1,45 @@
+import streamlit as st
+
+from setu import data
+from setu.chapters import panel
+from setu.metrics import metrics
+
+# Plan Your Visit: foreign tourist arrivals month by month
+
+
+def render():
+    st.title("📅 Plan Your Visit: Tourism Seasonality")
+    st.markdown("Understand the general flow of tourist arrivals to India throughout the year.")
+    
+    st.subheader("Foreign Tourist Arrivals (FTAs) Seasonality")
+
+    @panel("fta_seasonality")
+    def fta_seasonality_panel():
+        try:
+            df_season_fta = data.store.get("ftamonthly")
+
+            if not df_season_fta.empty:
+                # month_name is an ordered categorical from load (setu/schema.py), so this sorts January to December
+                with metrics.timer("transform", chapter="seasonality", stage="fta_month_order"):
+                    df_season_fta = df_season_fta.sort_values(by=['data_year', 'month_name'])
+
+                available_years_fta = sorted(df_season_fta['data_year'].unique(), reverse=True)
+                if available_years_fta:
+                    selected_year_fta = st.selectbox("Select Year to View FTA Seasonality:", available_years_fta, key="fta_year_select")
+                
+                    df_year_season_fta = df_season_fta[df_season_fta['data_year'] == selected_year_fta]
+
+                    if not df_year_season_fta.empty:
+                        st.write(f"Foreign Tourist Arrivals in {selected_year_fta}")
+                        st.line_chart(df_year_season_fta.set_index('month_name')['fta_count'])
+                        st.caption("Data reflects overall foreign tourist arrivals and can indicate peak and lean seasons for international visitors.")
+                    else:
+                        st.write(f"No FTA data for {selected_year_fta}.")
+                else:
+                    st.write("No years available for FTA seasonality.")
+            else:
+                st.write("Foreign Tourist Arrival seasonality data not available.")
+        except Exception as e:
+            st.error(f"Error loading FTA seasonality data: {e}")
+
+    fta_seasonality_panel()
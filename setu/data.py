@@ -0,0 +1,128 @@
+import os
+import tempfile
+
+import streamlit as st
+from streamlit.errors import StreamlitSecretNotFoundError
+
+from setu import queries
+from setu.cache import DiskTier, query_cache
+from setu.metrics import metrics
+from setu.store import DatasetStore
+
+# Data access shared by both entry scripts and every chapter (setu/chapters/):
+# the backend, the query caches in front of it, the dataset store and the card
+# image cache. The shell (setu/app.py) calls connect() at the start of every
+# run; chapters read conn and store from here, which also holds in a panel's
+# own reruns, where the shell does not run. The objects behind them are
+# process-wide (st.cache_resource), so every session sees the same ones.
+
+conn = None
+disk_cache = None
+store = None
+metrics_prometheus_file = None
+
+
+def _secret(key, default=None):
+    # st.secrets.get raises rather than returning default when there is no secrets.toml at all,
+    # which would leave the SETU_* environment fallbacks unreachable
+    try:
+        return st.secrets.get(key, default)
+    except (StreamlitSecretNotFoundError, FileNotFoundError):
+        return default
+
+
+@st.cache_resource
+def init_connection(backend):
+    # Driver imports happen here, so a process only loads the one it serves from:
+    #   postgres  - Neon/Postgres through a bounded pool shared by all sessions; optional
+    #               [postgres_pool] secrets (max_size, timeout, statement_timeout_ms, ...) size it per replica
+    #   snapshot  - a local Parquet/DuckDB snapshot written by `python -m setu.snapshot export`
+    #   snowflake - the [snowflake] secrets
+    if backend == "snapshot":
+        from setu.snapshot import DEFAULT_ROOT, SnapshotBackend
+        return SnapshotBackend(_secret("snapshot_root", os.environ.get("SETU_SNAPSHOT_ROOT", DEFAULT_ROOT)))
+    if backend == "snowflake":
+        import snowflake.connector
+        from setu.backends import SnowflakeBackend
+        return SnowflakeBackend(snowflake.connector.connect(**st.secrets["snowflake"], client_session_keep_alive=True))
+    from setu.backends import PostgresBackend
+    from setu.pool import ConnectionPool
+    return PostgresBackend(ConnectionPool(st.secrets["postgres_neon"], **_secret("postgres_pool", {})))
+
+
+# Stale results are served for up to max_stale seconds while one background refresh
+# runs; concurrent misses on the same query share a single database call.
+# Each cache is bounded by query_cache_mb (secrets) of deep result size, least recently used out first.
+@query_cache(ttl=600, max_stale=3600)
+def run_query(_conn, query, params=None):
+    return _conn.query(query, params)
+
+
+@query_cache(ttl=600, max_stale=3600)
+def run_query_df(_conn, query, params=None, fetch_mode="rows"):
+    return _conn.query_df(query, params, fetch_mode)
+
+
+def run_summary_df(query, params=None):
+    # run_query_df for queries on the growth summaries, which python -m setu.summaries builds
+    # rather than the data load: if one is missing, say so instead of the driver's error
+    try:
+        return run_query_df(conn, query, params)
+    except Exception:
+        present = {row[0] for row in conn.query(queries.SUMMARY_TABLES)}
+        missing = [table for table in queries.SUMMARIES if table not in present]
+        if missing:
+            raise RuntimeError(f"tourism_data.{', tourism_data.'.join(missing)} not built yet: "
+                               "run `python -m setu.summaries` after loading the data") from None
+        raise
+
+
+def iter_query_df(_conn, query, params=None, batch_size=5000):
+    # Lazy, uncached variant for callers that can work one batch at a time
+    yield from _conn.iter_batches(query, params, batch_size)
+
+
+@st.cache_resource
+def init_disk_cache(_conn):
+    # Optional Parquet tier under the caches (query_cache_dir in secrets or SETU_QUERY_CACHE_DIR), so restarts
+    # and new replicas start warm. Files are tied to the backend's data version, or to a fixed data_version secret.
+    root = _secret("query_cache_dir", os.environ.get("SETU_QUERY_CACHE_DIR"))
+    if not root:
+        return None
+    data_version = _secret("data_version")
+    return DiskTier(root, (lambda: data_version) if data_version else _conn.data_version,
+                    max_bytes=_secret("query_cache_disk_mb", 1024) * 2**20)
+
+
+@st.cache_resource
+def init_dataset_store(_conn, _disk_cache=None):
+    # Loaded once per server process and shared by every session; refreshed in the background
+    return DatasetStore(_conn, queries.DATASETS, refresh_interval=_secret("dataset_refresh_seconds", 600),
+                        disk=_disk_cache).start()
+
+
+@st.cache_resource
+def image_cache():
+    # Card images are fetched once and served as local thumbnails (image_cache_dir in secrets or
+    # SETU_IMAGE_CACHE_DIR, default setu-images in the temp dir); failing URLs are retried after image_retry_seconds.
+    # Only the chapters with cards call this, so only they load Pillow.
+    from setu.images import ImageCache
+    root = _secret("image_cache_dir", os.environ.get("SETU_IMAGE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "setu-images")))
+    return ImageCache(root, timeout=_secret("image_fetch_timeout", 5), negative_ttl=_secret("image_retry_seconds", 3600))
+
+
+def connect(backend=None):
+    # backend: "postgres", "snapshot" or "snowflake"; by default the backend secret or SETU_BACKEND, else postgres
+    global conn, disk_cache, store, metrics_prometheus_file
+    backend = backend or _secret("backend", os.environ.get("SETU_BACKEND", "postgres"))
+
+    # Optional exports for monitoring: every timing as JSON lines, and Prometheus text (textfile collector) after each run
+    metrics.jsonl_path = _secret("metrics_jsonl_file", os.environ.get("SETU_METRICS_JSONL"))
+    metrics_prometheus_file = _secret("metrics_prometheus_file", os.environ.get("SETU_METRICS_PROM"))
+
+    conn = init_connection(backend)
+    disk_cache = init_disk_cache(conn)
+    for cached in (run_query, run_query_df):
+        cached.cache.max_bytes = _secret("query_cache_mb", 256) * 2**20
+        cached.cache.disk = disk_cache
+    store = init_dataset_store(conn, disk_cache)
@@ -0,0 +1,123 @@
+import io
+import uuid
+
+import numpy as np
+import pandas as pd
+import psycopg2.extensions
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+
+# Postgres type OIDs, from cursor.description[i].type_code
+INT_OIDS = {20, 21, 23}
+FLOAT_OIDS = {700, 701, 1700}
+BOOL_OIDS = {16}
+DATETIME_OIDS = {1082, 1114, 1184}
+
+
+def strip_statement(query):
+    # DECLARE ... CURSOR FOR / COPY (...) need a bare statement, no trailing semicolon
+    return query.strip().rstrip(";").strip()
+
+
+def column_array(values, type_code):
+    if type_code in INT_OIDS:
+        if None in values:
+            return pd.array(values, dtype="Int64")
+        return np.array(values, dtype=np.int64)
+    if type_code in FLOAT_OIDS:
+        # NULL -> NaN, Decimal -> float
+        return np.array(values, dtype=np.float64)
+    if type_code in BOOL_OIDS:
+        return pd.array(values, dtype="boolean")
+    if type_code in DATETIME_OIDS:
+        return pd.to_datetime(pd.Series(values, dtype=object)).array
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def batch_to_frame(rows, description):
+    # Transposes one fetchmany() batch straight into typed columns, so only a
+    # batch worth of row tuples is ever alive at once.
+    columns = list(zip(*rows)) if rows else [()] * len(description)
+    return pd.DataFrame({desc[0]: column_array(list(values), desc[1]) for desc, values in zip(description, columns)})
+
+
+def iter_query_batches(conn, query, params=None, batch_size=5000):
+    # Named (server-side) cursor: the result stays on the server and arrives
+    # batch_size rows at a time. Always yields at least one frame, so callers
+    # see the columns even for an empty result.
+    with conn.cursor(name=f"setu_stream_{uuid.uuid4().hex}") as cur:
+        cur.itersize = batch_size
+        cur.execute(strip_statement(query), params)
+        yielded = False
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows and yielded:
+                break
+            yield batch_to_frame(rows, cur.description)
+            yielded = True
+            if len(rows) < batch_size:
+                break
+
+
+def settle_nullable_ints(df):
+    # Nullable ints only where the column actually has NULLs
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.Int64Dtype) and not df[col].hasnans:
+            df[col] = df[col].astype(np.int64)
+    return df
+
+
+def concat_batches(batches):
+    frames = list(batches)
+    df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    return settle_nullable_ints(df)
+
+
+def arrow_type(type_code):
+    if type_code in INT_OIDS:
+        return pa.int64()
+    if type_code in FLOAT_OIDS:
+        return pa.float64()
+    if type_code in BOOL_OIDS:
+        return pa.bool_()
+    # Text, and datetimes (parsed by pandas afterwards: Postgres prints "+00" offsets)
+    return pa.string()
+
+
+def fetch_df_copy(conn, query, params=None):
+    # Bulk columnar path: COPY (query) TO STDOUT as CSV into one buffer, parsed
+    # in a single pass by Arrow's multithreaded CSV reader. Column types come
+    # from a LIMIT 0 probe of the same query.
+    query = strip_statement(query)
+    with conn.cursor() as cur:
+        if params is not None:
+            query = cur.mogrify(query, params).decode(psycopg2.extensions.encodings[conn.encoding])
+        cur.execute(f"SELECT * FROM ({query}) AS copy_probe LIMIT 0")
+        description = cur.description
+        buffer = io.BytesIO()
+        # Every non-NULL value is quoted, so empty strings and NULLs stay distinct
+        cur.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT csv, FORCE_QUOTE *)", buffer)
+
+    names = [desc[0] for desc in description]
+    if not buffer.getbuffer().nbytes:
+        return pd.DataFrame({desc[0]: column_array([], desc[1]) for desc in description})
+    buffer.seek(0)
+    table = pa_csv.read_csv(
+        buffer,
+        read_options=pa_csv.ReadOptions(column_names=names),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={desc[0]: arrow_type(desc[1]) for desc in description},
+            null_values=[""],
+            strings_can_be_null=True,
+            quoted_strings_can_be_null=False,
+            true_values=["t"],
+            false_values=["f"],
+        ),
+    )
+    df = table.to_pandas(types_mapper={pa.int64(): pd.Int64Dtype(), pa.bool_(): pd.BooleanDtype()}.get)
+    for desc in description:
+        if desc[1] in DATETIME_OIDS:
+            df[desc[0]] = pd.to_datetime(df[desc[0]])
+    return settle_nullable_ints(df)
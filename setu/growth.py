@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+
+# Period-on-period growth on whole columns. Rather than "12.34%" strings with
+# sentinels ("New Growth" -> 10000, "N/A" -> 0) parsed back into numbers,
+# growth() returns numbers plus explicit masks:
+#   pct     - percentage growth; NaN where it is undefined (new or missing),
+#             0 where both periods are zero
+#   new     - growth from zero: the previous period was 0, the current one > 0
+#   missing - either value is absent or not numeric
+# Display strings are a separate step (growth_labels), run only on the rows
+# a page actually shows.
+
+
+def _floats(values):
+    return pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+
+
+def growth(current, previous):
+    index = current.index if isinstance(current, pd.Series) else None
+    cur, prev = _floats(current), _floats(previous)
+    missing = np.isnan(cur) | np.isnan(prev)
+    zero_base = ~missing & (prev == 0)
+    new = zero_base & (cur > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = (cur - prev) / prev * 100
+    pct = np.where(missing | new, np.nan, np.where(zero_base, 0.0, pct))
+    return pd.DataFrame({"pct": pct, "new": new, "missing": missing}, index=index)
+
+
+def growth_labels(g):
+    # "12.34%", "New Growth" or "N/A", as the pages display them
+    return g["pct"].map("{:.2f}%".format).mask(g["new"], "New Growth").mask(g["missing"], "N/A")
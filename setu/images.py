@@ -0,0 +1,153 @@
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+import urllib.request
+from urllib.parse import urlsplit
+
+from PIL import Image, features
+
+from setu.metrics import metrics
+
+
+class ImageCache:
+    # Remote card images (the imageurl columns), fetched once and served as
+    # local thumbnails. Under root:
+    #   originals/<sha256 of the bytes>   each distinct image once, however many URLs point at it
+    #   urls/<sha256 of the url>.json     url -> {"sha256": ...}, or {"error": ..., "failed_at": ...}
+    #   thumbs/<sha256>-<width>.<ext>     resized once per width, WebP (JPEG where Pillow lacks WebP)
+    # A URL that failed (timeout, HTTP error, too large, not an image) is not
+    # tried again for negative_ttl seconds, so a dead host costs one timeout per
+    # negative_ttl instead of one per render. Concurrent sessions asking for the
+    # same URL share one download. Only http(s) URLs are fetched.
+
+    def __init__(self, root, timeout=5.0, max_bytes=10 * 2**20, negative_ttl=3600.0, quality=80):
+        self.root = root
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.negative_ttl = negative_ttl
+        self.quality = quality
+        self.format, self.extension = ("WEBP", "webp") if features.check("webp") else ("JPEG", "jpg")
+        self._urls = {}  # url -> record, as in urls/
+        self._locks = {}  # url or thumbnail path -> Lock, so each is fetched/resized once
+        self._lock = threading.Lock()
+        self.counters = dict.fromkeys(["hits", "fetches", "failures", "negative_hits", "thumbnails"], 0)
+        for sub in ("originals", "urls", "thumbs"):
+            os.makedirs(os.path.join(root, sub), exist_ok=True)
+
+    def _key_lock(self, key):
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _count(self, name):
+        with self._lock:
+            self.counters[name] += 1
+
+    def _write(self, path, data):
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def _record_path(self, url):
+        return os.path.join(self.root, "urls", f"{hashlib.sha256(url.encode()).hexdigest()}.json")
+
+    def _record(self, url):
+        record = self._urls.get(url)
+        if record is None:
+            try:
+                with open(self._record_path(url)) as f:
+                    record = json.load(f)
+            except (OSError, ValueError):
+                return None
+            self._urls[url] = record
+        return record
+
+    def _usable(self, record):
+        if record is None:
+            return False
+        if "sha256" in record:
+            return os.path.exists(self._original_path(record["sha256"]))
+        return time.time() - record["failed_at"] < self.negative_ttl
+
+    def _original_path(self, digest):
+        return os.path.join(self.root, "originals", digest)
+
+    def _download(self, url):
+        request = urllib.request.Request(url, headers={"User-Agent": "sanskriti-setu-image-cache"})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            data = response.read(self.max_bytes + 1)
+        if len(data) > self.max_bytes:
+            raise ValueError(f"larger than {self.max_bytes} bytes")
+        with Image.open(io.BytesIO(data)) as img:
+            img.verify()
+        return data
+
+    def original(self, url):
+        # -> path of the original image, or None if it cannot be had
+        if not isinstance(url, str) or urlsplit(url.strip()).scheme not in ("http", "https"):
+            return None
+        url = url.strip()
+        record, fetched = self._record(url), False
+        if not self._usable(record):
+            with self._key_lock(url):
+                record = self._record(url)
+                if not self._usable(record):
+                    record, fetched = self._fetch(url), True
+        if not fetched:
+            self._count("hits" if "sha256" in record else "negative_hits")
+        return self._original_path(record["sha256"]) if "sha256" in record else None
+
+    def _fetch(self, url):
+        start = time.perf_counter()
+        try:
+            data = self._download(url)
+        except Exception as e:
+            record, nbytes = {"error": f"{type(e).__name__}: {e}", "failed_at": time.time()}, 0
+            self._count("failures")
+        else:
+            digest = hashlib.sha256(data).hexdigest()
+            if not os.path.exists(self._original_path(digest)):
+                self._write(self._original_path(digest), data)
+            record, nbytes = {"sha256": digest}, len(data)
+            self._count("fetches")
+        metrics.record("image", {"stage": "fetch", "outcome": "ok" if nbytes else "failed"},
+                       time.perf_counter() - start, nbytes=nbytes)
+        self._urls[url] = record
+        try:
+            self._write(self._record_path(url), json.dumps(record).encode())
+        except OSError:
+            pass
+        return record
+
+    def thumbnail(self, url, width):
+        # -> path of a thumbnail at most width pixels wide (never upscaled), or None
+        original = self.original(url)
+        if original is None:
+            return None
+        path = os.path.join(self.root, "thumbs", f"{os.path.basename(original)}-{width}.{self.extension}")
+        if os.path.exists(path):
+            return path
+        with self._key_lock(path):
+            if not os.path.exists(path):
+                start = time.perf_counter()
+                try:
+                    with Image.open(original) as img:
+                        img.thumbnail((width, width * 100))
+                        if self.format == "JPEG" and img.mode not in ("RGB", "L"):
+                            img = img.convert("RGB")
+                        buffer = io.BytesIO()
+                        img.save(buffer, self.format, quality=self.quality)
+                except Exception:
+                    return None
+                self._write(path, buffer.getvalue())
+                self._count("thumbnails")
+                metrics.record("image", {"stage": "thumbnail", "outcome": "ok"}, time.perf_counter() - start,
+                               nbytes=len(buffer.getvalue()))
+        return path
+
+    def stats(self):
+        with self._lock:
+            return {"root": self.root, "format": self.format, "urls": len(self._urls), **self.counters}
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+
+# In-memory lookup structures over the dataset store's frames, built with
+# DatasetStore.derive: once per data refresh, shared by every session and
+# never modified after they are built, so pages copy before reshaping.
+
+STATE_VISITOR_COLUMNS = {
+    "Domestic Visitors": "domestic_visitors_yr2",
+    "Foreign Visitors": "foreign_visitors_yr2",
+}
+
+
+def top_states(frames, n=10):
+    # {(year, visitor type): the year's top n states, sorted} for Home's Top 10
+    # view; years are the data_period_yr2 values as strings, as the page lists
+    # them. Visitor counts come typed from load (setu/schema.py), NULLs already 0
+    df = frames["state_tourism_visits"]
+    years = df["data_period_yr2"].astype(str)
+    index = {}
+    for visitor_type, column in STATE_VISITOR_COLUMNS.items():
+        ranked = pd.DataFrame({
+            "year": years,
+            "state_ut": df["state_ut"],
+            column: df[column],
+        }).sort_values(column, ascending=False, kind="stable")
+        for year, group in ranked.groupby("year", sort=False):
+            index[(year, visitor_type)] = group[["state_ut", column]].head(n).reset_index(drop=True)
+    return index
+
+
+MONUMENT_TREND_DTYPE = [
+    ("financial_year_range", object),
+    ("domestic_visitors_fy_start", "float64"),
+    ("domestic_visitors_fy_end", "float64"),
+    ("foreign_visitors_fy_start", "float64"),
+    ("foreign_visitors_fy_end", "float64"),
+]
+
+
+def monument_trends(frames):
+    # {circle: {monument: structured array of its years}} for the monument
+    # drill-down, in the dataset's order; missing visitor counts (NA in the
+    # dataset, see setu/schema.py) are NaN
+    df = frames["monument_stats"]
+    records = np.empty(len(df), dtype=MONUMENT_TREND_DTYPE)
+    records["financial_year_range"] = df["financial_year_range"].to_numpy(dtype=object)
+    for field, _ in MONUMENT_TREND_DTYPE[1:]:
+        records[field] = df[field].to_numpy(dtype="float64", na_value=np.nan)
+    index = {}
+    for (circle, monument), positions in df.groupby(["circle", "monument_name"], sort=False, observed=True).indices.items():
+        years = records[positions]
+        years.flags.writeable = False
+        index.setdefault(circle, {})[monument] = years
+    return index
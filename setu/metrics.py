@@ -0,0 +1,120 @@
+import collections
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+
+HELP = {
+    "query": "Wall time of data lookups, by source, query and cache outcome.",
+    "chapter": "Wall time of rendering each chapter.",
+    "panel": "Wall time of rendering each interactive panel, by chapter, panel and run (full script or the panel's own rerun).",
+    "transform": "Wall time of pandas transform stages, by chapter and stage.",
+    "image": "Wall time of fetching remote card images and resizing them, by stage and outcome.",
+}
+
+
+def _label_text(labels):
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in labels)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(labels, escaped)) + "}"
+
+
+class Metrics:
+    # In-process record of where time goes, shared by every session:
+    #   query     - each data lookup: wall time, rows, bytes, cache outcome
+    #   chapter   - each render of a chapter branch
+    #   panel     - each render of an interactive panel (a fragment), in a full run or its own rerun
+    #   transform - named pandas stages inside a chapter
+    #   image     - card image downloads and thumbnail resizes (setu/images.py)
+    # Per-series totals feed the ?debug=1 panel and the Prometheus export;
+    # the most recent events are kept for the JSON-lines export, and are also
+    # appended to jsonl_path as they happen when it is set.
+
+    def __init__(self, max_events=5000):
+        self._lock = threading.Lock()
+        self._events = collections.deque(maxlen=max_events)
+        self._series = {}  # (kind, labels) -> [count, seconds, max_seconds, rows, bytes]
+        self.jsonl_path = None
+
+    def record(self, kind, labels, seconds, rows=None, nbytes=None, **detail):
+        event = {"ts": round(time.time(), 3), "kind": kind, **labels, "ms": round(seconds * 1000, 3)}
+        if rows is not None:
+            event["rows"] = rows
+        if nbytes is not None:
+            event["bytes"] = nbytes
+        event.update(detail)
+        key = (kind, tuple(sorted(labels.items())))
+        with self._lock:
+            series = self._series.setdefault(key, [0, 0.0, 0.0, 0, 0])
+            series[0] += 1
+            series[1] += seconds
+            series[2] = max(series[2], seconds)
+            series[3] += rows or 0
+            series[4] += nbytes or 0
+            self._events.append(event)
+            if self.jsonl_path:
+                with open(self.jsonl_path, "a") as f:
+                    f.write(json.dumps(event, default=str) + "\n")
+
+    @contextmanager
+    def timer(self, kind, **labels):
+        # Yields a dict; rows/nbytes put in it are recorded with the timing
+        fields = {}
+        start = time.perf_counter()
+        try:
+            yield fields
+        finally:
+            self.record(kind, labels, time.perf_counter() - start, **fields)
+
+    def summary(self, kind):
+        with self._lock:
+            series = [(dict(labels), values) for (k, labels), values in self._series.items() if k == kind]
+        rows = []
+        for labels, (count, seconds, max_seconds, n_rows, n_bytes) in series:
+            row = {**labels, "count": count, "total_ms": seconds * 1000, "avg_ms": seconds * 1000 / count, "max_ms": max_seconds * 1000}
+            if kind == "query":
+                row.update(rows=n_rows, bytes=n_bytes)
+            rows.append(row)
+        return pd.DataFrame(rows).sort_values("total_ms", ascending=False, ignore_index=True) if rows else pd.DataFrame()
+
+    def to_prometheus(self):
+        with self._lock:
+            series = [(kind, labels, list(values)) for (kind, labels), values in self._series.items()]
+        lines = []
+        for kind in HELP:
+            kind_series = [(_label_text(labels), values) for k, labels, values in series if k == kind]
+            if not kind_series:
+                continue
+            name = f"setu_{kind}_seconds"
+            lines += [f"# HELP {name} {HELP[kind]}", f"# TYPE {name} summary"]
+            for labels, values in kind_series:
+                lines += [f"{name}_count{labels} {values[0]}", f"{name}_sum{labels} {values[1]:.6f}"]
+            lines.append(f"# TYPE {name}_max gauge")
+            lines += [f"{name}_max{labels} {values[2]:.6f}" for labels, values in kind_series]
+            if kind == "query":
+                for metric, index in (("setu_query_rows_total", 3), ("setu_query_bytes_total", 4)):
+                    lines.append(f"# TYPE {metric} counter")
+                    lines += [f"{metric}{labels} {values[index]}" for labels, values in kind_series]
+        return "\n".join(lines) + "\n"
+
+    def to_jsonl(self):
+        with self._lock:
+            events = list(self._events)
+        return "".join(json.dumps(event, default=str) + "\n" for event in events)
+
+    def write_prometheus(self, path):
+        # Atomic, for node_exporter's textfile collector
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp, path)
+
+    def reset(self):
+        with self._lock:
+            self._events.clear()
+            self._series.clear()
+
+
+metrics = Metrics()
@@ -0,0 +1,199 @@
+import collections
+import threading
+import time
+from contextlib import contextmanager
+
+import psycopg2
+import psycopg2.extensions
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class ConnectionPool:
+    # Bounded, thread-safe psycopg2 pool. Connections are validated on every
+    # checkout (cheap local check, plus a SELECT 1 once they have sat idle for
+    # ping_after seconds) and broken ones are replaced transparently.
+
+    def __init__(self, connect_kwargs, min_size=1, max_size=10, timeout=10.0,
+                 connect_timeout=5, statement_timeout_ms=30000, ping_after=10.0,
+                 max_lifetime=1800.0, retries=1):
+        self.connect_kwargs = dict(connect_kwargs)
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.statement_timeout_ms = statement_timeout_ms
+        self.ping_after = ping_after
+        self.max_lifetime = max_lifetime
+        self.retries = retries
+
+        self._cond = threading.Condition()
+        self._idle = collections.deque()  # (conn, idle_since)
+        self._born = {}
+        self._size = 0
+        self._in_use = 0
+        self._waiting = 0
+        self._closed = False
+
+        self._checkouts = 0
+        self._timeouts = 0
+        self._reconnects = 0
+        self._checkout_ms = collections.deque(maxlen=1000)
+
+        for _ in range(min_size):
+            conn = self._connect()
+            with self._cond:
+                self._size += 1
+                self._idle.append((conn, time.monotonic()))
+
+    def _connect(self):
+        kwargs = {"connect_timeout": self.connect_timeout, **self.connect_kwargs}
+        conn = psycopg2.connect(**kwargs)
+        if self.statement_timeout_ms:
+            # Set per session rather than via the "options" startup parameter,
+            # which Neon's pooled endpoint rejects.
+            with conn.cursor() as cur:
+                cur.execute("SET statement_timeout = %s", (int(self.statement_timeout_ms),))
+            conn.commit()
+        self._born[conn] = time.monotonic()
+        return conn
+
+    @staticmethod
+    def _is_broken(conn):
+        return bool(conn.closed) or conn.get_transaction_status() == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN
+
+    def _alive(self, conn, idle_since):
+        if self._is_broken(conn):
+            return False
+        now = time.monotonic()
+        if self.max_lifetime and now - self._born.get(conn, now) > self.max_lifetime:
+            return False
+        if now - idle_since < self.ping_after:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _close_quietly(self, conn):
+        self._born.pop(conn, None)
+        try:
+            conn.close()
+        except psycopg2.Error:
+            pass
+
+    def getconn(self):
+        start = time.perf_counter()
+        deadline = start + self.timeout
+        conn = idle_since = None
+        with self._cond:
+            if self._closed:
+                raise PoolTimeout("connection pool is closed")
+            while True:
+                if self._idle:
+                    conn, idle_since = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeout(f"no connection available within {self.timeout}s (max_size={self.max_size})")
+                # Only callers actually blocked on the pool count as waiting
+                self._waiting += 1
+                try:
+                    self._cond.wait(remaining)
+                finally:
+                    self._waiting -= 1
+
+        try:
+            if conn is not None and not self._alive(conn, idle_since):
+                self._close_quietly(conn)
+                conn = None
+                with self._cond:
+                    self._reconnects += 1
+            if conn is None:
+                conn = self._connect()
+        except BaseException:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._in_use += 1
+            self._checkouts += 1
+            self._checkout_ms.append((time.perf_counter() - start) * 1000)
+        return conn
+
+    def putconn(self, conn):
+        discard = self._closed or self._is_broken(conn)
+        if not discard:
+            try:
+                # End the implicit transaction so pooled connections never sit
+                # "idle in transaction" between checkouts.
+                conn.rollback()
+            except psycopg2.Error:
+                discard = True
+        if discard:
+            self._close_quietly(conn)
+        with self._cond:
+            self._in_use -= 1
+            if discard:
+                self._size -= 1
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self):
+        conn = self.getconn()
+        try:
+            yield conn
+        finally:
+            self.putconn(conn)
+
+    def run(self, fn):
+        # Runs fn(conn) on a pooled connection, retrying on a fresh connection
+        # when the server dropped the one we were handed mid-query.
+        for attempt in range(self.retries + 1):
+            with self.connection() as conn:
+                try:
+                    return fn(conn)
+                except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                    if attempt >= self.retries or not self._is_broken(conn):
+                        raise
+            with self._cond:
+                self._reconnects += 1
+
+    def stats(self):
+        with self._cond:
+            samples = sorted(self._checkout_ms)
+            return {
+                "max_size": self.max_size,
+                "size": self._size,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "waiting": self._waiting,
+                "checkouts": self._checkouts,
+                "timeouts": self._timeouts,
+                "reconnects": self._reconnects,
+                "checkout_ms_avg": sum(samples) / len(samples) if samples else 0.0,
+                "checkout_ms_p95": samples[int(0.95 * (len(samples) - 1))] if samples else 0.0,
+                "checkout_ms_max": samples[-1] if samples else 0.0,
+            }
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                conn, _ = self._idle.pop()
+                self._size -= 1
+                self._close_quietly(conn)
+            self._cond.notify_all()
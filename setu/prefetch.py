@@ -0,0 +1,32 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+
+def prefetch(fetch, needs, max_workers=8):
+    # Starts every independent query a chapter needs at once and returns
+    # {name: Future}. Page code calls .result() right where it renders each
+    # widget, so widgets appear as their own data arrives and the page waits
+    # for the slowest query instead of the sum of all of them.
+    # needs: {name: query}, {name: (query, params)} or {name: {fetch kwargs}}
+    ctx = get_script_run_ctx(suppress_warning=True)
+
+    def attach_ctx():
+        # Cached query functions look up the session's script context.
+        if ctx is not None:
+            add_script_run_ctx(threading.current_thread(), ctx)
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(needs))),
+                                  thread_name_prefix="prefetch", initializer=attach_ctx)
+    futures = {}
+    for name, need in needs.items():
+        if isinstance(need, dict):
+            futures[name] = executor.submit(fetch, **need)
+        elif isinstance(need, tuple):
+            futures[name] = executor.submit(fetch, *need)
+        else:
+            futures[name] = executor.submit(fetch, need)
+    # Workers exit once the submitted queries finish; nothing waits here.
+    executor.shutdown(wait=False)
+    return futures
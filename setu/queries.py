@@ -0,0 +1,312 @@
+# Every query the app runs, written once in SQL that Postgres (Neon), DuckDB
+# (the local snapshot backend) and Snowflake all accept:
+#   - unquoted lowercase identifiers, schema-qualified with tourism_data.
+#   - parameters as %(name)s, literal percent signs as %%
+# Backends translate the placeholders where their driver needs something else.
+
+# Tables exported into a local snapshot (see setu/snapshot.py)
+TABLES = [
+    "state_tourism_visits",
+    "all_monuments_stats",
+    "top_monuments",
+    "ftamonthly",
+    "traditionalartforms",
+    "untouchedgems",
+    "artistsupportschemesummary",
+    "senioryoungartistscheme",
+    "buildinggrantsstudiotheatre",
+    "veteranartistsapplications",
+    "gurushishyaparamparaassistance",
+    "culturalfunctionproductiongrant",
+    "schemewisefundsreleased",
+    "museumgrantschemefunds",
+    "asimonumentpreservationexpenditure",
+]
+
+STATE_TOURISM_VISITS = """
+    SELECT state_ut, domestic_visitors_yr1, foreign_visitors_yr1,
+           domestic_visitors_yr2, foreign_visitors_yr2,
+           data_period_yr1, data_period_yr2
+    FROM tourism_data.state_tourism_visits
+    WHERE state_ut NOT LIKE 'Total%%'
+      AND state_ut NOT LIKE 'GRAND TOTAL'
+      AND state_ut IS NOT NULL;
+"""
+
+def _growth_columns(kind, current, previous, period, name):
+    # <kind>_growth_pct: percentage growth, NULL for growth from zero, 0 when both periods are zero
+    # <kind>_growth_new: 1 for growth from zero (see setu/growth.py)
+    # <kind>_growth_rank: 1 = fastest growing in the period, growth from zero first
+    return f"""
+           CASE WHEN {previous} = 0 AND {current} > 0 THEN NULL
+                WHEN {previous} = 0 THEN 0
+                ELSE ({current} - {previous}) * 100.0 / {previous} END AS {kind}_growth_pct,
+           CASE WHEN {previous} = 0 AND {current} > 0 THEN 1 ELSE 0 END AS {kind}_growth_new,
+           ROW_NUMBER() OVER (PARTITION BY {period} ORDER BY
+               CASE WHEN {previous} = 0 AND {current} > 0 THEN 1 ELSE 0 END DESC,
+               CASE WHEN {previous} = 0 THEN 0 ELSE ({current} - {previous}) * 100.0 / {previous} END DESC,
+               {name}) AS {kind}_growth_rank"""
+
+
+# Growth summaries, materialised as tourism_data.<name> by `python -m setu.summaries` (and by the
+# snapshot backend when it loads): domestic, foreign and total growth with per-period ranks for every
+# state and monument in every period. Visitor counts missing in the source count as 0.
+STATE_GROWTH_SUMMARY = """
+    WITH visits AS (
+        SELECT state_ut, data_period_yr1, data_period_yr2,
+               COALESCE(domestic_visitors_yr1, 0) AS domestic_visitors_yr1,
+               COALESCE(foreign_visitors_yr1, 0) AS foreign_visitors_yr1,
+               COALESCE(domestic_visitors_yr2, 0) AS domestic_visitors_yr2,
+               COALESCE(foreign_visitors_yr2, 0) AS foreign_visitors_yr2
+        FROM tourism_data.state_tourism_visits
+        WHERE state_ut NOT LIKE 'Total%%'
+          AND state_ut NOT LIKE 'GRAND TOTAL'
+          AND state_ut IS NOT NULL
+          AND data_period_yr2 IS NOT NULL
+    ),
+    totals AS (
+        SELECT visits.*,
+               domestic_visitors_yr1 + foreign_visitors_yr1 AS total_visitors_yr1,
+               domestic_visitors_yr2 + foreign_visitors_yr2 AS total_visitors_yr2
+        FROM visits
+    )
+    SELECT totals.*,
+           ROW_NUMBER() OVER (PARTITION BY data_period_yr2 ORDER BY total_visitors_yr2 DESC, state_ut) AS visits_rank,""" + ",".join(
+    _growth_columns(kind, f"{kind}_visitors_yr2", f"{kind}_visitors_yr1", "data_period_yr2", "state_ut")
+    for kind in ("domestic", "foreign", "total")
+) + """
+    FROM totals;
+"""
+
+# in_top_monuments: listed in top_monuments for the same financial year (other than "Others")
+MONUMENT_GROWTH_SUMMARY = """
+    WITH visits AS (
+        SELECT m.circle, m.monument_name, m.financial_year_range,
+               COALESCE(m.domestic_visitors_fy_start, 0) AS domestic_visitors_fy_start,
+               COALESCE(m.foreign_visitors_fy_start, 0) AS foreign_visitors_fy_start,
+               COALESCE(m.domestic_visitors_fy_end, 0) AS domestic_visitors_fy_end,
+               COALESCE(m.foreign_visitors_fy_end, 0) AS foreign_visitors_fy_end,
+               CASE WHEN t.monument_name IS NOT NULL THEN 1 ELSE 0 END AS in_top_monuments
+        FROM tourism_data.all_monuments_stats m
+        LEFT JOIN (
+            SELECT DISTINCT financial_year, monument_name FROM tourism_data.top_monuments
+            WHERE monument_name != 'Others'
+        ) t ON t.financial_year = m.financial_year_range AND t.monument_name = m.monument_name
+        WHERE m.monument_name NOT LIKE 'Total%%' AND m.circle NOT LIKE 'Total%%'
+          AND m.financial_year_range IS NOT NULL
+    ),
+    totals AS (
+        SELECT visits.*,
+               domestic_visitors_fy_start + foreign_visitors_fy_start AS total_visitors_fy_start,
+               domestic_visitors_fy_end + foreign_visitors_fy_end AS total_visitors_fy_end
+        FROM visits
+    )
+    SELECT totals.*,
+           ROW_NUMBER() OVER (PARTITION BY financial_year_range ORDER BY total_visitors_fy_end DESC, monument_name, circle) AS visits_rank,""" + ",".join(
+    _growth_columns(kind, f"{kind}_visitors_fy_end", f"{kind}_visitors_fy_start", "financial_year_range", "monument_name, circle")
+    for kind in ("domestic", "foreign", "total")
+) + """
+    FROM totals;
+"""
+
+SUMMARIES = {
+    "state_growth_summary": STATE_GROWTH_SUMMARY,
+    "monument_growth_summary": MONUMENT_GROWTH_SUMMARY,
+}
+
+# Which of the growth summaries exist, in lower case (Snowflake keeps unquoted names in upper case)
+SUMMARY_TABLES = """
+    SELECT lower(table_name) FROM information_schema.tables
+    WHERE lower(table_schema) = 'tourism_data' AND lower(table_name) IN ({});
+""".format(", ".join(f"'{table}'" for table in SUMMARIES))
+
+# Home's rising states for one period (data_period_yr2): outside the top_n by total visits, above
+# min_growth percent, the rising_n fastest growing.
+RISING_STATES = """
+    SELECT state_ut, data_period_yr1, data_period_yr2, total_visitors_yr1, total_visitors_yr2
+    FROM tourism_data.state_growth_summary
+    WHERE data_period_yr2 = %(period)s
+      AND visits_rank > %(top_n)s
+      AND (total_growth_new = 1 OR total_growth_pct > %(min_growth)s)
+    ORDER BY total_growth_rank
+    LIMIT %(rising_n)s;
+"""
+
+TRADITIONAL_ART_FORMS = "SELECT artformname, stateoforigin, category, briefdescription, imageurl, responsibleconsumptiontip FROM tourism_data.traditionalartforms;"
+
+# The Traditional Art Forms card grid: art forms per (state, category), for the filter options and page
+# counts, and one page of cards at a time with the filters applied (NULL = All). Catalogues are small
+# enough for LIMIT/OFFSET, which lets the grid jump to any page.
+ART_FORM_FACETS = """
+    SELECT stateoforigin, category, COUNT(*) AS art_forms
+    FROM tourism_data.traditionalartforms
+    GROUP BY stateoforigin, category;
+"""
+
+ART_FORMS_PAGE = """
+    SELECT artformname, stateoforigin, category, briefdescription, imageurl, responsibleconsumptiontip
+    FROM tourism_data.traditionalartforms
+    WHERE (%(state)s IS NULL OR stateoforigin = %(state)s)
+      AND (%(category)s IS NULL OR category = %(category)s)
+    ORDER BY artformname, stateoforigin, category
+    LIMIT %(page_size)s OFFSET %(offset)s;
+"""
+
+# How many art forms come before one named art form under the filters: which page the search opens
+ART_FORMS_BEFORE = """
+    SELECT COUNT(*) AS art_forms
+    FROM tourism_data.traditionalartforms
+    WHERE (%(state)s IS NULL OR stateoforigin = %(state)s)
+      AND (%(category)s IS NULL OR category = %(category)s)
+      AND artformname < %(name)s;
+"""
+
+MONUMENT_FYS = """
+    SELECT DISTINCT financial_year_range FROM tourism_data.all_monuments_stats
+    WHERE financial_year_range IS NOT NULL AND monument_name NOT LIKE 'Total%%' AND circle NOT LIKE 'Total%%'
+    ORDER BY financial_year_range DESC;
+"""
+
+# Destinations' rising monuments for one financial year: not among that year's top_monuments, above
+# min_growth percent total growth, the max_rows fastest growing, with domestic/foreign breakdowns.
+RISING_MONUMENTS = """
+    SELECT circle, monument_name, domestic_visitors_fy_start, foreign_visitors_fy_start,
+           domestic_visitors_fy_end, foreign_visitors_fy_end, total_visitors_fy_start, total_visitors_fy_end
+    FROM tourism_data.monument_growth_summary
+    WHERE financial_year_range = %(period)s
+      AND in_top_monuments = 0
+      AND (total_growth_new = 1 OR total_growth_pct > %(min_growth)s)
+    ORDER BY total_growth_rank
+    LIMIT %(max_rows)s;
+"""
+
+TOP10_DOMESTIC_MONUMENTS_FY2022_23 = """
+    SELECT monument_name, number_of_visitors
+    FROM tourism_data.top_monuments
+    WHERE financial_year = 'FY2022-23'
+      AND visitor_type = 'Domestic'
+      AND monument_name != 'Others'
+    ORDER BY data_rank;
+"""
+
+# Every monument's yearly figures, grouped circle -> monument -> years for the drill-down
+# (setu/indexes.py monument_trends); the ORDER BY is the order the selectboxes list them in.
+MONUMENT_STATS = """
+    SELECT circle, monument_name, financial_year_range,
+           domestic_visitors_fy_start, domestic_visitors_fy_end,
+           foreign_visitors_fy_start, foreign_visitors_fy_end
+    FROM tourism_data.all_monuments_stats
+    WHERE circle NOT LIKE 'Total%%' AND monument_name NOT LIKE 'Total%%'
+    ORDER BY circle, monument_name, financial_year_range;
+"""
+
+SCHEMEWISE_FUNDS = """
+    SELECT scheme_name, funds_2019_20, funds_2020_21, funds_2021_22, funds_2022_23, funds_2023_24
+    FROM tourism_data.schemewisefundsreleased
+    WHERE scheme_name NOT LIKE 'Total%%' AND scheme_name NOT LIKE 'Grand Total';
+"""
+
+ARTIST_SUPPORT_SCHEME_SUMMARY = """
+    SELECT schemeid, schemename, administeringbody, focusarea,
+           datapoint_example_state_ut, datapoint_example_value, relevancetoplatform
+    FROM tourism_data.artistsupportschemesummary;
+"""
+
+SPECIFIC_SCHEMES = {
+    "buildinggrantsstudiotheatre": "SELECT state_ut, amount_21_22, amount_22_23, amount_released_authorized_23_24 FROM tourism_data.buildinggrantsstudiotheatre WHERE state_ut NOT LIKE 'Total%%';",
+    "veteranartistsapplications": "SELECT state_ut, apps_2019_20, apps_2020_21, apps_2021_22, apps_2022_23, apps_2023_24 FROM tourism_data.veteranartistsapplications WHERE state_ut NOT LIKE 'Total%%';",
+    "gurushishyaparamparaassistance": "SELECT state_ut, amount_21_22, amount_22_23, amount_released_authorized_23_24 FROM tourism_data.gurushishyaparamparaassistance WHERE state_ut NOT LIKE 'Total%%' AND state_ut IS NOT NULL;",
+    "culturalfunctionproductiongrant": "SELECT state_ut, amount_21_22, amount_22_23, amount_released_23_24 FROM tourism_data.culturalfunctionproductiongrant WHERE state_ut NOT LIKE 'Total%%' AND state_ut IS NOT NULL;",
+    "museumgrantschemefunds": "SELECT state_name, organization_name, type_of_museum, funds_2019_20, funds_2020_21, funds_2021_22, funds_2022_23, funds_2023_24 FROM tourism_data.museumgrantschemefunds WHERE state_name NOT LIKE 'Total%%' AND state_name IS NOT NULL;",
+    "asimonumentpreservationexpenditure": "SELECT year, allocation, expenditure FROM tourism_data.asimonumentpreservationexpenditure;",
+}
+
+# Senior/Young Artist Scheme beneficiaries, listed a page at a time in (state, age, user_id) order
+# with keyset paging: the after_* parameters are the last row of the previous page, or all NULL for
+# the first page. The comparison is spelled out rather than written as a row value, which Snowflake
+# lacks; the leading >= gives Postgres an index range to start from (see setu/summaries.py).
+# Beneficiaries with no state, age or user_id have no place in the order and are left out.
+SYAS_STATE_COUNTS = """
+    SELECT new_states AS state, COUNT(*) AS beneficiaries
+    FROM tourism_data.senioryoungartistscheme
+    WHERE new_states IS NOT NULL AND age IS NOT NULL AND user_id IS NOT NULL
+    GROUP BY new_states
+    ORDER BY new_states;
+"""
+
+SYAS_PAGE = """
+    SELECT new_states AS state, subject, gender, age, phy_handicaped, user_id
+    FROM tourism_data.senioryoungartistscheme
+    WHERE new_states IS NOT NULL AND age IS NOT NULL AND user_id IS NOT NULL
+      AND (%(after_state)s IS NULL OR (new_states >= %(after_state)s
+           AND (new_states > %(after_state)s
+                OR (new_states = %(after_state)s AND (age > %(after_age)s
+                    OR (age = %(after_age)s AND user_id > %(after_user_id)s))))))
+    ORDER BY new_states, age, user_id
+    LIMIT %(page_size)s;
+"""
+
+# The same for one state, paged on (age, user_id)
+SYAS_STATE_PAGE = """
+    SELECT new_states AS state, subject, gender, age, phy_handicaped, user_id
+    FROM tourism_data.senioryoungartistscheme
+    WHERE new_states = %(state)s AND age IS NOT NULL AND user_id IS NOT NULL
+      AND (%(after_age)s IS NULL OR (age >= %(after_age)s
+           AND (age > %(after_age)s OR user_id > %(after_user_id)s)))
+    ORDER BY age, user_id
+    LIMIT %(page_size)s;
+"""
+
+# Using a window function to get the latest data for each month/year combo
+FTA_SEASONALITY = """
+WITH RankedFTAs AS (
+    SELECT
+        month_name,
+        data_year,
+        fta_count,
+        ROW_NUMBER() OVER (PARTITION BY month_name, data_year ORDER BY report_source_year DESC) as rn
+    FROM tourism_data.ftamonthly
+)
+SELECT month_name, data_year, fta_count
+FROM RankedFTAs
+WHERE rn = 1;
+"""
+
+UNTOUCHED_GEMS = """
+    SELECT gemname, state, region, type, culturalsignificance,
+           whypotentiallyuntouched, responsibletravelguideline, imageurl
+    FROM tourism_data.untouchedgems;
+"""
+
+# The Untouched Cultural Gems card grid, a page at a time
+UNTOUCHED_GEM_COUNT = "SELECT COUNT(*) AS gems FROM tourism_data.untouchedgems;"
+
+UNTOUCHED_GEMS_PAGE = """
+    SELECT gemname, state, region, type, culturalsignificance,
+           whypotentiallyuntouched, responsibletravelguideline, imageurl
+    FROM tourism_data.untouchedgems
+    ORDER BY gemname, state
+    LIMIT %(page_size)s OFFSET %(offset)s;
+"""
+
+UNTOUCHED_GEMS_BEFORE = "SELECT COUNT(*) AS gems FROM tourism_data.untouchedgems WHERE gemname < %(name)s;"
+
+# What the dataset store (setu/store.py) loads at startup: every query the
+# chapters run that doesn't depend on a widget selection.
+DATASETS = {
+    "state_tourism_visits": STATE_TOURISM_VISITS,
+    # traditionalartforms and untouchedgems are the full catalogues behind the sidebar search
+    # (setu/search.py); their own chapters read a page at a time
+    "traditionalartforms": TRADITIONAL_ART_FORMS,
+    "monument_fys": MONUMENT_FYS,
+    "top10_domestic_monuments_fy2022_23": TOP10_DOMESTIC_MONUMENTS_FY2022_23,
+    "monument_stats": MONUMENT_STATS,
+    "schemewisefundsreleased": SCHEMEWISE_FUNDS,
+    "artistsupportschemesummary": ARTIST_SUPPORT_SCHEME_SUMMARY,
+    **SPECIFIC_SCHEMES,
+    "syas_state_counts": SYAS_STATE_COUNTS,
+    "ftamonthly": FTA_SEASONALITY,
+    "untouchedgems": UNTOUCHED_GEMS,
+    "art_form_facets": ART_FORM_FACETS,
+    "untouched_gem_count": UNTOUCHED_GEM_COUNT,
+}
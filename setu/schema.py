@@ -0,0 +1,130 @@
+import numpy as np
+import pandas as pd
+
+# Column types for the datasets the store loads (DATASETS in setu/queries.py),
+# applied once per load by DatasetStore, so the frames every session shares
+# arrive typed and pages no longer coerce columns on each rerun.
+#
+# Each column maps to (dtype, fill): NULLs and values that do not parse as
+# numbers become fill, or stay missing when fill is None. Whole counts are
+# int32 (nullable Int32 where a missing count is shown as "N/A"), repeated
+# labels are categoricals. Amounts in lakhs/crores stay float64: float32
+# keeps only ~7 significant digits, and 12345.67 would print as 12345.6699.
+# Columns not listed are left as the backend returned them.
+
+MONTHS = ["January", "February", "March", "April", "May", "June",
+          "July", "August", "September", "October", "November", "December"]
+
+COUNT = ("int32", 0)
+COUNT_OR_MISSING = ("Int32", None)
+AMOUNT = ("float64", 0)
+LABEL = ("category", None)
+
+SCHEMAS = {
+    "state_tourism_visits": {
+        "state_ut": LABEL,
+        "domestic_visitors_yr1": COUNT,
+        "foreign_visitors_yr1": COUNT,
+        "domestic_visitors_yr2": COUNT,
+        "foreign_visitors_yr2": COUNT,
+    },
+    "traditionalartforms": {
+        "stateoforigin": LABEL,
+        "category": LABEL,
+    },
+    "top10_domestic_monuments_fy2022_23": {
+        "number_of_visitors": COUNT,
+    },
+    "monument_stats": {
+        "circle": LABEL,
+        "domestic_visitors_fy_start": COUNT_OR_MISSING,
+        "domestic_visitors_fy_end": COUNT_OR_MISSING,
+        "foreign_visitors_fy_start": COUNT_OR_MISSING,
+        "foreign_visitors_fy_end": COUNT_OR_MISSING,
+    },
+    "schemewisefundsreleased": {
+        f"funds_{year}": AMOUNT for year in ["2019_20", "2020_21", "2021_22", "2022_23", "2023_24"]
+    },
+    "buildinggrantsstudiotheatre": {
+        "state_ut": LABEL,
+        "amount_21_22": AMOUNT,
+        "amount_22_23": AMOUNT,
+        "amount_released_authorized_23_24": AMOUNT,
+    },
+    "veteranartistsapplications": {
+        "state_ut": LABEL,
+        **{f"apps_{year}": COUNT for year in ["2019_20", "2020_21", "2021_22", "2022_23", "2023_24"]},
+    },
+    "gurushishyaparamparaassistance": {
+        "state_ut": LABEL,
+        "amount_21_22": AMOUNT,
+        "amount_22_23": AMOUNT,
+        "amount_released_authorized_23_24": AMOUNT,
+    },
+    "culturalfunctionproductiongrant": {
+        "state_ut": LABEL,
+        "amount_21_22": AMOUNT,
+        "amount_22_23": AMOUNT,
+        "amount_released_23_24": AMOUNT,
+    },
+    "museumgrantschemefunds": {
+        "state_name": LABEL,
+        "type_of_museum": LABEL,
+        **{f"funds_{year}": AMOUNT for year in ["2019_20", "2020_21", "2021_22", "2022_23", "2023_24"]},
+    },
+    "asimonumentpreservationexpenditure": {
+        "allocation": ("float64", None),
+        "expenditure": ("float64", None),
+    },
+    "syas_state_counts": {
+        "beneficiaries": COUNT,
+    },
+    "ftamonthly": {
+        # In calendar order, so sorting by month sorts January to December
+        "month_name": (pd.CategoricalDtype(MONTHS, ordered=True), None),
+        "fta_count": COUNT_OR_MISSING,
+    },
+    "untouchedgems": {
+        "state": LABEL,
+        "type": LABEL,
+    },
+    "art_form_facets": {
+        "stateoforigin": LABEL,
+        "category": LABEL,
+        "art_forms": COUNT,
+    },
+    "untouched_gem_count": {
+        "gems": COUNT,
+    },
+}
+
+
+def _numbers(series, dtype, fill):
+    values = pd.to_numeric(series, errors="coerce").astype("float64")
+    if fill is not None:
+        values = values.fillna(fill)
+    target = pd.api.types.pandas_dtype(dtype)
+    if target.kind in "iu":
+        info = np.iinfo(getattr(target, "numpy_dtype", target))
+        if (values % 1).fillna(0).any():
+            raise ValueError("has fractional values")
+        if (values < info.min).any() or (values > info.max).any():
+            raise ValueError(f"has values outside the {dtype} range")
+    return values.astype(target)
+
+
+def apply(name, df):
+    # Types df's columns as SCHEMAS[name] declares, in place. Raises
+    # ValueError when a declared column is missing or its values do not fit,
+    # which the store reports as that dataset's load error.
+    for column, (dtype, fill) in SCHEMAS.get(name, {}).items():
+        if column not in df.columns:
+            raise ValueError(f"dataset {name!r} has no column {column!r}")
+        try:
+            if isinstance(dtype, pd.CategoricalDtype) or dtype == "category":
+                df[column] = df[column].astype(dtype)
+            else:
+                df[column] = _numbers(df[column], dtype, fill)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"dataset {name!r} column {column!r} {e}") from e
+    return df
@@ -0,0 +1,167 @@
+import bisect
+import math
+import re
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+# In-memory search indexes over the dataset store's frames, built with
+# DatasetStore.derive once per data refresh and shared by every session.
+
+
+def trigrams(text):
+    # pg_trgm-style: lowercased words, each padded with two spaces in front and
+    # one behind, so word starts weigh more and word order does not matter
+    grams = set()
+    for word in re.findall(r"\w+", str(text).casefold()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class TrigramIndex:
+    # Fuzzy, typo-tolerant lookup over short texts. Each trigram maps to the
+    # ids of the entries containing it; a query counts shared trigrams per
+    # entry in one bincount, so a lookup costs about as much as the postings
+    # it touches. Entries are ranked by the share of the query's trigrams they
+    # contain (so a prefix typed so far already matches), then by similarity
+    # of the whole text, which prefers the closest names.
+
+    def __init__(self, texts, payloads):
+        self.payloads = list(payloads)
+        postings = defaultdict(list)
+        self._sizes = np.zeros(len(self.payloads), dtype=np.int32)
+        for i, text in enumerate(texts):
+            grams = trigrams(text)
+            self._sizes[i] = len(grams)
+            for gram in grams:
+                postings[gram].append(i)
+        self._postings = {gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()}
+
+    def __len__(self):
+        return len(self.payloads)
+
+    def search(self, query, limit=10, threshold=0.5):
+        # -> [(score, payload)], best first; score is the share of the query matched
+        grams = trigrams(query)
+        hits = [self._postings[gram] for gram in grams if gram in self._postings]
+        if not hits:
+            return []
+        shared = np.bincount(np.concatenate(hits), minlength=len(self.payloads))
+        coverage = shared / len(grams)
+        similarity = shared / (len(grams) + self._sizes - shared)
+        candidates = np.flatnonzero(coverage >= threshold)
+        order = np.lexsort((-similarity[candidates], -coverage[candidates]))[:limit]
+        return [(float(coverage[i]), self.payloads[i]) for i in candidates[order]]
+
+
+def monument_search(frames):
+    # Every (circle, monument) of the drill-down, searchable by monument and circle name
+    pairs = frames["monument_stats"][["circle", "monument_name"]].drop_duplicates()
+    return TrigramIndex(
+        (f"{monument} {circle}" for circle, monument in pairs.itertuples(index=False)),
+        pairs.itertuples(index=False, name=None),
+    )
+
+
+def terms(text):
+    # Words, casefolded, with a plain trailing "s" dropped so "caves" finds "cave"
+    if pd.isna(text):
+        return []
+    return [w[:-1] if len(w) > 3 and w.endswith("s") and not w.endswith("ss") else w
+            for w in re.findall(r"\w+", str(text).casefold())]
+
+
+class BM25Index:
+    # Ranked full-text search (Okapi BM25) over documents made of weighted
+    # fields: a term found in a name counts more than one in a description.
+    # Postings are per-term arrays of (document id, weighted term frequency);
+    # a query scores only the documents in its terms' postings. The last query
+    # word also matches as a prefix, for as-you-type use.
+
+    def __init__(self, documents, k1=1.2, b=0.75, min_prefix=3):
+        # documents: iterable of (payload, [(text, weight), ...])
+        self.payloads = []
+        self.k1 = k1
+        self.min_prefix = min_prefix
+        postings = defaultdict(lambda: ([], []))
+        lengths = []
+        for doc_id, (payload, fields) in enumerate(documents):
+            self.payloads.append(payload)
+            counts = defaultdict(float)
+            for text, weight in fields:
+                for term in terms(text):
+                    counts[term] += weight
+            for term, tf in counts.items():
+                postings[term][0].append(doc_id)
+                postings[term][1].append(tf)
+            lengths.append(sum(counts.values()))
+        n = len(self.payloads)
+        lengths = np.array(lengths, dtype="float64")
+        avg_length = lengths.mean() if n and lengths.mean() > 0 else 1.0
+        self._norm = k1 * (1 - b + b * lengths / avg_length)
+        self._postings = {}
+        for term, (ids, tfs) in postings.items():
+            idf = math.log(1 + (n - len(ids) + 0.5) / (len(ids) + 0.5))
+            self._postings[term] = (np.array(ids, dtype=np.int32), np.array(tfs, dtype="float64"), idf)
+        self._vocabulary = sorted(self._postings)
+
+    def __len__(self):
+        return len(self.payloads)
+
+    def _term_scores(self, term):
+        ids, tfs, idf = self._postings[term]
+        scores = np.zeros(len(self.payloads))
+        scores[ids] = idf * tfs * (self.k1 + 1) / (tfs + self._norm[ids])
+        return scores
+
+    def _prefixed(self, prefix):
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        end = bisect.bisect_left(self._vocabulary, prefix + "\U0010ffff")
+        return self._vocabulary[start:end]
+
+    def search(self, query, limit=20):
+        # -> [(score, payload)], best first
+        words = terms(query)
+        if not words or not self.payloads:
+            return []
+        scores = np.zeros(len(self.payloads))
+        for term in words[:-1]:
+            if term in self._postings:
+                scores += self._term_scores(term)
+        last = words[-1]
+        candidates = self._prefixed(last) if len(last) >= self.min_prefix else [last] if last in self._postings else []
+        if candidates:
+            # Best completion per document, so a prefix is not rewarded for matching many words
+            scores += np.max([self._term_scores(term) for term in candidates], axis=0)
+        hits = np.flatnonzero(scores > 0)
+        order = np.argsort(-scores[hits], kind="stable")[:limit]
+        return [(float(scores[i]), self.payloads[i]) for i in hits[order]]
+
+
+# dataset -> (title column, {column: weight}, context columns carried in the payload)
+CATALOGUE_FIELDS = {
+    "traditionalartforms": ("artformname", {
+        "artformname": 3.0, "category": 2.0, "stateoforigin": 2.0,
+        "briefdescription": 1.0, "responsibleconsumptiontip": 0.5,
+    }, ["category", "stateoforigin"]),
+    "untouchedgems": ("gemname", {
+        "gemname": 3.0, "type": 2.0, "state": 2.0, "region": 1.0,
+        "culturalsignificance": 1.0, "whypotentiallyuntouched": 0.5,
+    }, ["type", "state"]),
+    "artistsupportschemesummary": ("schemename", {
+        "schemename": 3.0, "focusarea": 2.0, "administeringbody": 1.0, "relevancetoplatform": 1.0,
+    }, ["administeringbody"]),
+}
+
+
+def catalogue_search(frames):
+    # One ranked index over art forms, untouched gems and artist support schemes;
+    # payloads are (dataset, title, {context column: value})
+    def documents():
+        for dataset, (title, weights, context) in CATALOGUE_FIELDS.items():
+            for row in frames[dataset].to_dict("records"):
+                payload = (dataset, row[title], {col: row[col] for col in context})
+                yield payload, [(row[col], weight) for col, weight in weights.items()]
+    return BM25Index(documents())
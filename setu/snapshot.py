@@ -0,0 +1,150 @@
+# Local snapshot backend: every table the app reads, exported from Postgres
+# into a versioned Parquet snapshot and queried in-process with DuckDB, so a
+# demo or edge replica can serve every chapter without a database.
+#
+#   python -m setu.snapshot export [--dsn ...] [--root snapshots]
+#
+# Layout: <root>/<version>/<table>.parquet + manifest.json, and <root>/CURRENT
+# naming the version the app should serve.
+
+import argparse
+import datetime
+import json
+import os
+import re
+import shutil
+
+import duckdb
+import pandas as pd
+
+from setu import queries
+
+DEFAULT_ROOT = "snapshots"
+
+
+def to_duckdb_sql(query):
+    # %(name)s -> $name, %% -> %
+    return re.sub(r"%\((\w+)\)s", r"$\1", query).replace("%%", "%")
+
+
+def write_snapshot(frames, root=DEFAULT_ROOT, version=None, source="export"):
+    # frames: iterable of (table, DataFrame); written into a fresh version
+    # directory that only becomes CURRENT once every table is on disk.
+    version = version or datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    final_dir = os.path.join(root, version)
+    work_dir = final_dir + ".tmp"
+    shutil.rmtree(work_dir, ignore_errors=True)
+    os.makedirs(work_dir)
+
+    manifest = {
+        "version": version,
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "source": source,
+        "tables": {},
+    }
+    for table, df in frames:
+        path = os.path.join(work_dir, f"{table}.parquet")
+        df.to_parquet(path, index=False)
+        manifest["tables"][table] = {"rows": len(df), "columns": list(df.columns), "bytes": os.path.getsize(path)}
+    with open(os.path.join(work_dir, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    os.replace(work_dir, final_dir)
+    current_tmp = os.path.join(root, "CURRENT.tmp")
+    with open(current_tmp, "w") as f:
+        f.write(version + "\n")
+    os.replace(current_tmp, os.path.join(root, "CURRENT"))
+    return manifest
+
+
+def export_snapshot(backend, root=DEFAULT_ROOT, tables=None, version=None):
+    frames = ((table, backend.query_df(f"SELECT * FROM tourism_data.{table};", fetch_mode="copy")) for table in tables or queries.TABLES)
+    return write_snapshot(frames, root, version, source=backend.name)
+
+
+class SnapshotBackend:
+    name = "snapshot"
+
+    def __init__(self, root=DEFAULT_ROOT, version=None):
+        if version is None:
+            with open(os.path.join(root, "CURRENT")) as f:
+                version = f.read().strip()
+        self.directory = os.path.join(root, version)
+        with open(os.path.join(self.directory, "manifest.json")) as f:
+            self.manifest = json.load(f)
+
+        # Tables are loaded into DuckDB's memory once, so queries never touch disk
+        self._db = duckdb.connect(":memory:")
+        self._db.execute("CREATE SCHEMA tourism_data")
+        for table in self.manifest["tables"]:
+            path = os.path.join(self.directory, f"{table}.parquet").replace("'", "''")
+            self._db.execute(f"CREATE TABLE tourism_data.{table} AS SELECT * FROM read_parquet('{path}')")
+        # The growth summaries (setu/summaries.py) are derived, so they are built here rather than exported
+        for table, query in queries.SUMMARIES.items():
+            if table not in self.manifest["tables"]:
+                self._db.execute(f"CREATE TABLE tourism_data.{table} AS {to_duckdb_sql(query)}")
+
+    def _cursor(self):
+        # A DuckDB connection must not be shared across threads; cursors are
+        # cheap per-thread handles onto the same in-memory database.
+        return self._db.cursor()
+
+    def query_df(self, query, params=None, fetch_mode="rows"):
+        with self._cursor() as cur:
+            return cur.execute(to_duckdb_sql(query), params).df()
+
+    def query(self, query, params=None):
+        with self._cursor() as cur:
+            return cur.execute(to_duckdb_sql(query), params).fetchall()
+
+    def iter_batches(self, query, params=None, batch_size=5000):
+        with self._cursor() as cur:
+            reader = cur.execute(to_duckdb_sql(query), params).fetch_record_batch(batch_size)
+            yielded = False
+            for batch in reader:
+                yield batch.to_pandas()
+                yielded = True
+            if not yielded:
+                yield pd.DataFrame({field.name: pd.Series(dtype=field.type.to_pandas_dtype()) for field in reader.schema})
+
+    def data_version(self):
+        return self.manifest["version"]
+
+    def stats(self):
+        return {
+            "backend": self.name,
+            "version": self.manifest["version"],
+            "created_at": self.manifest["created_at"],
+            "tables": len(self.manifest["tables"]),
+            "rows": sum(t["rows"] for t in self.manifest["tables"].values()),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the app's tables into a local Parquet snapshot")
+    sub = parser.add_subparsers(dest="command", required=True)
+    export = sub.add_parser("export")
+    export.add_argument("--dsn", help="libpq connection string (default: [postgres_neon] in .streamlit/secrets.toml)")
+    export.add_argument("--root", default=DEFAULT_ROOT)
+    args = parser.parse_args()
+
+    from setu.backends import PostgresBackend
+    from setu.pool import ConnectionPool
+
+    if args.dsn:
+        connect_kwargs = {"dsn": args.dsn}
+    else:
+        import toml
+        connect_kwargs = toml.load(os.path.join(".streamlit", "secrets.toml"))["postgres_neon"]
+    pool = ConnectionPool(connect_kwargs, max_size=1)
+    try:
+        manifest = export_snapshot(PostgresBackend(pool), args.root)
+    finally:
+        pool.close()
+    for table, info in manifest["tables"].items():
+        print(f"{table:40s} {info['rows']:>10,} rows {info['bytes']:>12,} bytes")
+    print(f"snapshot {manifest['version']} written to {os.path.join(args.root, manifest['version'])}")
+
+
+if __name__ == "__main__":
+    main()
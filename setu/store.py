@@ -0,0 +1,112 @@
+import threading
+import time
+
+from setu import schema
+from setu.cache import normalize_sql
+from setu.metrics import metrics
+from setu.prefetch import prefetch
+
+
+class DatasetStore:
+    # Every dataset the chapters read, loaded once up front and held in memory
+    # for all sessions. A daemon thread reloads them every refresh_interval
+    # seconds and swaps the new frames in atomically, so page code never waits
+    # on the database after the first load. A dataset that fails to refresh
+    # keeps serving its previous frame.
+    #
+    # With a DiskTier (setu/cache.py) the first load is served from local
+    # Parquet files when the data version still matches, and every load from
+    # the database is written back for the next process to start from.
+
+    def __init__(self, backend, datasets, refresh_interval=600.0, disk=None):
+        self.backend = backend
+        self.disk = disk
+        self.datasets = dict(datasets)
+        self.refresh_interval = refresh_interval
+        self.errors = {}
+        self._state = (0, None, {})  # (version, loaded_at, frames)
+        self._derived = {}
+        self._derive_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def version(self):
+        return self._state[0]
+
+    def _fetch(self, name, query, use_disk=False):
+        start = time.perf_counter()
+        key = ("dataset", normalize_sql(query))
+        df = self.disk.get(key) if use_disk and self.disk is not None else None
+        source = "disk"
+        if df is None:
+            # COPY path on Postgres: typed columns straight from Arrow
+            df, source = self.backend.query_df(query, fetch_mode="copy"), "load"
+        # Compact column types (setu/schema.py), once per load; files from before a schema change are retyped
+        df = schema.apply(name, df)
+        if source == "load" and self.disk is not None:
+            self.disk.put(key, df)
+        metrics.record("query", {"source": "store", "query": name, "cache": source}, time.perf_counter() - start,
+                       rows=len(df), nbytes=int(df.memory_usage(deep=True).sum()))
+        return df
+
+    def load(self):
+        version, _, frames = self._state
+        frames = dict(frames)
+        errors = {}
+        needs = {name: {"name": name, "query": query, "use_disk": version == 0} for name, query in self.datasets.items()}
+        for name, future in prefetch(self._fetch, needs).items():
+            try:
+                frames[name] = future.result()
+            except Exception as e:
+                errors[name] = f"{type(e).__name__}: {e}"
+        self.errors = errors
+        self._state = (version + 1, time.time(), frames)
+
+    def start(self):
+        self.load()
+        if self._thread is None and self.refresh_interval:
+            self._thread = threading.Thread(target=self._refresh_loop, name="dataset-store-refresh", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _refresh_loop(self):
+        while not self._stop.wait(self.refresh_interval):
+            try:
+                self.load()
+            except Exception as e:
+                self.errors = {"*": f"{type(e).__name__}: {e}"}
+
+    def get(self, name, copy=True):
+        frames = self._state[2]
+        if name not in frames:
+            raise KeyError(f"dataset {name!r} is not loaded: {self.errors.get(name, 'unknown dataset')}")
+        # Pages reshape what they get, so they receive their own copy by default
+        return frames[name].copy() if copy else frames[name]
+
+    def derive(self, name, builder):
+        # Structures built from the datasets (indexes, rankings), rebuilt at
+        # most once per refresh and shared like the datasets themselves.
+        version, _, frames = self._state
+        cached = self._derived.get(name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        with self._derive_lock:
+            cached = self._derived.get(name)
+            if cached is None or cached[0] != version:
+                cached = (version, builder(frames))
+                self._derived[name] = cached
+        return cached[1]
+
+    def stats(self):
+        version, loaded_at, frames = self._state
+        return {
+            "version": version,
+            "loaded_at": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(loaded_at)) if loaded_at else None,
+            "refresh_interval": self.refresh_interval,
+            "errors": self.errors,
+            "datasets": {name: {"rows": len(df), "bytes": int(df.memory_usage(deep=True).sum())} for name, df in frames.items()},
+        }
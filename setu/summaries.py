@@ -0,0 +1,110 @@
+# Growth summary tables: domestic, foreign and total growth with per-period
+# ranks for every state and monument in every available period, computed in
+# one pass inside the database (see SUMMARIES in setu/queries.py). The apps
+# read their "rising" lists from these with a plain filtered lookup. On
+# Postgres it also adds the indexes the apps' paged lookups on the loaded
+# tables need (TABLE_INDEXES).
+#
+#   python -m setu.summaries [--dsn ...]    Postgres/Neon (default: [postgres_neon] in .streamlit/secrets.toml)
+#   python -m setu.summaries --snowflake    Snowflake ([snowflake] in .streamlit/secrets.toml)
+#
+# Rerun after loading new data. The snapshot backend builds its own copies
+# when it loads a snapshot, so exports do not need them.
+
+import argparse
+import os
+import time
+
+from setu import queries
+
+# Postgres only: Snowflake has no secondary indexes on standard tables
+INDEXES = {
+    "state_growth_summary": ["data_period_yr2, total_growth_rank", "state_ut"],
+    "monument_growth_summary": ["financial_year_range, total_growth_rank", "monument_name, circle"],
+}
+
+# On loaded tables, so created only if missing rather than rebuilt
+TABLE_INDEXES = {
+    "senioryoungartistscheme": ["new_states, age, user_id"],
+}
+
+
+def statements(snowflake=False):
+    # Builds each summary as <table>_new beside the one the apps are reading.
+    # Run without bind parameters, so %% is written as a plain %
+    for table, query in queries.SUMMARIES.items():
+        yield f"DROP TABLE IF EXISTS tourism_data.{table}_new"
+        yield f"CREATE TABLE tourism_data.{table}_new AS {query.strip().rstrip(';').replace('%%', '%')}"
+        if not snowflake:
+            for i, columns in enumerate(INDEXES.get(table, [])):
+                yield f"CREATE INDEX {table}_new_idx{i} ON tourism_data.{table}_new ({columns})"
+    if not snowflake:
+        for table, index_columns in TABLE_INDEXES.items():
+            for i, columns in enumerate(index_columns):
+                yield f"CREATE INDEX IF NOT EXISTS {table}_setu_idx{i} ON tourism_data.{table} ({columns})"
+
+
+def swap_statements(snowflake=False):
+    # Puts the <table>_new tables in place of the old ones. Postgres takes no
+    # schema on a rename target and keeps the table in its schema; Snowflake
+    # needs one, or moves the table to the session's schema.
+    for table in queries.SUMMARIES:
+        yield f"DROP TABLE IF EXISTS tourism_data.{table}"
+        yield f"ALTER TABLE tourism_data.{table}_new RENAME TO {'tourism_data.' if snowflake else ''}{table}"
+        if not snowflake:
+            for i, _ in enumerate(INDEXES.get(table, [])):
+                yield f"ALTER INDEX tourism_data.{table}_new_idx{i} RENAME TO {table}_idx{i}"
+
+
+def build(conn, snowflake=False):
+    # conn is a DB-API connection. The slow part, filling <table>_new, is
+    # committed on its own while the apps keep reading the current tables;
+    # the swap is a second, short transaction. Its DROP takes an exclusive
+    # lock, so on Postgres it waits for queries already reading the old table
+    # and holds up new ones for the few milliseconds until the commit, after
+    # which they read the new table. Snowflake commits each DDL statement on
+    # its own, so there a query can land between the drop and the rename.
+    with conn.cursor() as cur:
+        for statement in statements(snowflake):
+            cur.execute(statement)
+        rows = {}
+        for table in queries.SUMMARIES:
+            cur.execute(f"SELECT COUNT(*) FROM tourism_data.{table}_new")
+            rows[table] = cur.fetchone()[0]
+    conn.commit()
+    with conn.cursor() as cur:
+        for statement in swap_statements(snowflake):
+            cur.execute(statement)
+    conn.commit()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the growth summary tables and indexes the apps read")
+    parser.add_argument("--dsn", help="libpq connection string (default: [postgres_neon] in .streamlit/secrets.toml)")
+    parser.add_argument("--snowflake", action="store_true", help="build them in Snowflake instead")
+    args = parser.parse_args()
+
+    if args.snowflake:
+        import snowflake.connector
+        import toml
+        conn = snowflake.connector.connect(**toml.load(os.path.join(".streamlit", "secrets.toml"))["snowflake"])
+    elif args.dsn:
+        import psycopg2
+        conn = psycopg2.connect(args.dsn)
+    else:
+        import psycopg2
+        import toml
+        conn = psycopg2.connect(**toml.load(os.path.join(".streamlit", "secrets.toml"))["postgres_neon"])
+    try:
+        started = time.perf_counter()
+        rows = build(conn, snowflake=args.snowflake)
+    finally:
+        conn.close()
+    for table, count in rows.items():
+        print(f"{table:40s} {count:>10,} rows")
+    print(f"built in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()